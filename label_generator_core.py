@@ -1,12 +1,37 @@
 import os
+import sys
 import random
 import csv
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
 import numpy as np
 import matplotlib.font_manager as fm
-import colorsys
+from matplotlib.colors import hsv_to_rgb
 import io
-from PIL import ImageChops
+import functools
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+try:
+    from scipy.ndimage import grey_dilation, grey_erosion
+except ImportError:
+    grey_dilation = grey_erosion = None  # Fall back to PIL rank filters
+try:
+    import pyvips
+except (ImportError, OSError):  # OSError when the libvips library itself is missing
+    pyvips = None  # Fall back to PIL encoders
+
+
+# Translation tables between plain and Unicode superscript characters
+_ASCII_TO_SUPER = str.maketrans({
+    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
+    '-': '⁻', '+': '⁺'
+})
+_SUPER_TO_ASCII = str.maketrans({
+    '⁰': '0', '¹': '1', '²': '2', '³': '3', '⁴': '4',
+    '⁵': '5', '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9',
+    '⁻': '-', '⁺': '+'
+})
 
 
 def encode_scientific_notation(text):
@@ -14,108 +39,148 @@ def encode_scientific_notation(text):
     Convert Unicode superscript notation to plain-text representation
     Example: "1.23 × 10⁻³" → "1.23 × 10^{-3}"
     """
-    superscript_map = {
-        '⁰': '0', '¹': '1', '²': '2', '³': '3', '⁴': '4',
-        '⁵': '5', '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9',
-        '⁻': '-', '⁺': '+'
-    }
-    
     # Convert superscript characters to normal digits
-    converted = []
-    for char in text:
-        converted.append(superscript_map.get(char, char))
+    plain_text = text.translate(_SUPER_TO_ASCII)
     
     # Check if scientific notation exists
-    plain_text = ''.join(converted)
     if " × 10" in plain_text:
         return plain_text.replace(" × 10", " × 10^{") + "}"
     return plain_text
 
 
-def apply_gamma_distortion(image, gamma=random.uniform(1.8, 2.4)):
-    """Apply gamma correction to an image in a memory-safe way"""
-    # Convert to numpy array while keeping the image in memory
+def gamma_lut(gamma):
+    """Build a 256-entry uint8 lookup table applying the given gamma"""
+    return (np.linspace(0, 1, 256) ** gamma * 255).astype(np.uint8).tolist()
+
+
+def apply_gamma_distortion(image, gamma=random.uniform(1.8, 2.4), lut=None):
+    """Apply gamma correction to an image through a per-band lookup table"""
+    if lut is None:
+        lut = gamma_lut(gamma)
     if image.mode == 'RGBA':
-        # Preserve alpha channel
-        r, g, b, a = image.split()
-        rgb_image = Image.merge('RGB', (r, g, b))
-        arr = np.array(rgb_image) / 255.0
-        arr = np.power(arr, gamma)
-        arr = (arr * 255).astype(np.uint8)
-        distorted = Image.fromarray(arr).convert('RGB')
-        r, g, b = distorted.split()
-        return Image.merge('RGBA', (r, g, b, a))
-    else:
-        # For RGB or other modes
-        arr = np.array(image.copy()) / 255.0  # Use copy() to ensure data stays in memory
-        arr = np.power(arr, gamma)
-        return Image.fromarray((arr * 255).astype(np.uint8))
+        # Preserve alpha channel with an identity table
+        return image.point(lut * 3 + list(range(256)))
+    # For RGB or other 8-bit modes
+    return image.point(lut * len(image.getbands()))
 
 
-class RealismEnhancer:
-    def __init__(self, settings):
-        self.settings = settings
-    
+@functools.lru_cache(maxsize=32)
+def sepia_matrix(intensity):
+    """Build the sepia conversion matrix for Image.convert at a given intensity"""
+    return (
+        0.393 + 0.1*intensity, 0.769, 0.189, 0,
+        0.349, 0.686 + 0.1*intensity, 0.168, 0,
+        0.272, 0.534, 0.131 + 0.1*intensity, 0
+    )
 
-    def apply_mode_aware(self, image, is_transparent=False):
-        """Apply realism effects with mode awareness"""
-        # Work on a copy to avoid closed file issues
-        img = image.copy()
-        intensity = self.settings.realism_intensity
-        
-        # Store original mode
-        original_mode = img.mode
-        
-        # For transparent images, handle alpha channel carefully
-        if is_transparent and original_mode == 'RGBA':
-            # Separate alpha channel
-            r, g, b, a = img.split()
-            rgb_image = Image.merge('RGB', (r, g, b))
-            
-            # Apply effects to RGB only
-            if random.random() < intensity:
-                rgb_image = self.apply_realistic_scaling(rgb_image)
-            if random.random() < intensity:
-                rgb_image = self.add_jpeg_artifacts(rgb_image)
-            if random.random() < intensity/2:
-                rgb_image = self.apply_subpixel_shift(rgb_image)
-            if random.random() < intensity:
-                rgb_image = self.apply_gamma_distortion(rgb_image)
-            if random.random() < intensity:
-                rgb_image = self.add_complex_background(rgb_image)
-            if random.random() < intensity/3:
-                rgb_image = self.apply_font_rendering_variation(rgb_image)
-            
-            # Merge back with original alpha
-            r2, g2, b2 = rgb_image.split()
-            return Image.merge('RGBA', (r2, g2, b2, a))
-        else:
-            # Apply normally for RGB images
-            return self.apply(img) 
+
+@functools.lru_cache(maxsize=16)
+def _grid_background(width, height, grid_size):
+    """White background with grid lines, copied before use"""
+    # Label sizes vary with text, rotation and scaling, so only a few are kept
+    base = np.full((height, width, 3), 0xFF, dtype=np.uint8)
+    base[:, ::grid_size] = 0xEE
+    base[::grid_size, :] = 0xEE
+    return base
 
 
+@functools.lru_cache(maxsize=256)
+def hex_to_rgb(hex_color):
+    """Parse '#RRGGBB' or short '#RGB' into an (r, g, b) tuple"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        a, b, c = hex_color
+        hex_color = a + a + b + b + c + c
+    return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
 
 
+def vips_encode(image, output_format, dpi):
+    """Encode an L, RGB or RGBA image as PNG or JPEG with libvips"""
+    vips_image = pyvips.Image.new_from_memory(
+        image.tobytes(), image.width, image.height, len(image.getbands()), 'uchar')
+    # libvips keeps the resolution in pixels per millimetre
+    vips_image = vips_image.copy(
+        interpretation='b-w' if image.mode == 'L' else 'srgb',
+        xres=dpi / 25.4, yres=dpi / 25.4)
+    if output_format == 'png':
+        return vips_image.write_to_buffer('.png', compression=6)
+    return vips_image.write_to_buffer('.jpg', Q=95)
 
+
+@functools.lru_cache(maxsize=256)
+def _load_font(family, size):
+    """Load a TrueType font once per (family, size), falling back to defaults"""
+    # Families are loaded from their file, other names are left to ImageFont
+    path = _safe_fonts().get(family, family)
+    # ValueError covers sizes of 0 or less, base size minus variation can go there
+    try:
+        return ImageFont.truetype(path, size)
+    except (OSError, ValueError):
+        try:
+            return ImageFont.truetype("arial.ttf", size)
+        except (OSError, ValueError):
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1)
+def _safe_fonts():
+    """
+    Regular faces of the installed font families as {family: file path}
+    Styles come from matplotlib's font cache, so no font file is opened here.
+    Scanned once per process.
+    """
+    system_fonts = set(fm.findSystemFonts())
+    fonts = {}
+    for entry in fm.fontManager.ttflist:
+        if (entry.fname in system_fonts and entry.style == 'normal' and entry.variant == 'normal'
+                and entry.weight in (400, 'normal', 'regular') and entry.stretch == 'normal'):
+            fonts.setdefault(entry.name, entry.fname)
+    if not fonts:
+        # Matplotlib ships DejaVu Sans, so there is always one font to use
+        fonts['DejaVu Sans'] = fm.findfont('DejaVu Sans')
+    return dict(sorted(fonts.items()))
+
+
+class RealismEnhancer:
+    def __init__(self, settings):
+        self.settings = settings
+        self._gamma_luts = {}  # Lookup tables keyed by quantized gamma
+        self._jpeg_buf = io.BytesIO()
     
-    def apply(self, image):
+
+    def apply(self, image, gates=None):
+        """
+        Apply realism effects to RGB and RGBA images alike
+        Effects only alter the colour bands of RGBA images (scaling resizes the
+        alpha band along with them), so transparent labels keep their alpha
+        without being split into bands and merged back.
+        Effects return new images and never modify their input, so callers
+        can pass an image they own without copying it first.
+        gates optionally holds six pre-drawn uniforms deciding each effect.
+        """
         #if  image.mode == 'RGBA':
         #    return image
-        # Work on a copy to avoid closed file issues
-        img = image.copy()
+        img = image
         intensity = self.settings.realism_intensity
+        if gates is None:
+            gates = [random.random() for _ in range(6)]
         
-        if random.random() < intensity:
+        # All dice are rolled upfront, leave early when no effect fires
+        thresholds = (intensity, intensity, intensity/2, intensity, intensity, intensity/3)
+        if not any(gate < threshold for gate, threshold in zip(gates, thresholds)):
+            return image
+        
+        if gates[0] < intensity:
             img = self.apply_realistic_scaling(img)
-        if random.random() < intensity:
+        if gates[1] < intensity:
             img = self.add_jpeg_artifacts(img)
-        if random.random() < intensity/2:
+        if gates[2] < intensity/2:
             img = self.apply_subpixel_shift(img)
-        if random.random() < intensity:
+        if gates[3] < intensity:
             img = self.apply_gamma_distortion(img)
-        if random.random() < intensity:
+        if gates[4] < intensity:
             img = self.add_complex_background(img)
-        if random.random() < intensity/3:
+        if gates[5] < intensity/3:
             img = self.apply_font_rendering_variation(img)
         return img
 
@@ -135,6 +200,15 @@ class RealismEnhancer:
         ]
         method = random.choice(methods)
         
+        # Near 1/2, 1/3, 1/4 use the box-averaging reduce instead of resampling
+        if scale_factor < 1:
+            factor = round(1 / scale_factor)
+            if factor > 1 and abs(1 / scale_factor - factor) < 0.05:
+                return image.reduce(factor)
+        # Large upscales look alike with any filter, block copy is cheapest
+        if scale_factor > 1.5:
+            method = Image.Resampling.NEAREST
+        
         return image.resize(new_size, method)
 
     def add_jpeg_artifacts(self, image):
@@ -142,58 +216,70 @@ class RealismEnhancer:
         min_quality = max(20, 90 - int(self.settings.realism_intensity * 50))
         max_quality = 90
         quality = random.randint(min_quality, max_quality)
+        # Near-maximum quality leaves no visible artifacts, skip the round-trip
+        if quality >= 88:
+            return image
         
-        buffer = io.BytesIO()
-        image.save(buffer, format='JPEG', quality=quality)
+        # Reuse one buffer for every encode/decode round-trip
+        buffer = self._jpeg_buf
         buffer.seek(0)
-        return Image.open(buffer).convert(image.mode)
+        buffer.truncate()
+        # JPEG has no alpha, compress the colour bands only
+        rgb = image.convert('RGB') if image.mode == 'RGBA' else image
+        rgb.save(buffer, format='JPEG', quality=quality)
+        buffer.seek(0)
+        decoded = Image.open(buffer)
+        decoded.load()  # Decode now, the buffer is overwritten by the next call
+        if image.mode == 'RGBA':
+            decoded.putalpha(image.getchannel('A'))
+            return decoded
+        return decoded if decoded.mode == image.mode else decoded.convert(image.mode)
         
     def apply_subpixel_shift(self, image):
         shift = random.randint(-1, 1)
-        if image.mode in ['RGB', 'RGBA']:
-            r, g, b, *a = image.split()
-            channels = [
-                ImageChops.offset(ch, shift, 0) 
-                for ch in (r, g, b)
-            ]
-            if a:
-                channels.append(a[0])
-            return Image.merge(image.mode, channels)
+        if shift and image.mode in ['RGB', 'RGBA']:
+            # Offset the colour channels horizontally with wrap-around
+            arr = np.asarray(image)
+            shifted = np.roll(arr, shift, axis=1)
+            if image.mode == 'RGBA':
+                shifted[:, :, 3] = arr[:, :, 3]  # Alpha stays in place
+            return Image.fromarray(shifted)
         return image
         
     def apply_gamma_distortion(self, image):
         min_gamma = max(1.5, 2.4 - self.settings.realism_intensity)
         max_gamma = min(3.0, 2.4 + self.settings.realism_intensity)
-        gamma = random.uniform(min_gamma, max_gamma)
-        return apply_gamma_distortion(image, gamma)
+        # Quantize gamma to 0.05 steps so lookup tables are reused across labels
+        gamma = round(random.uniform(min_gamma, max_gamma) * 20) / 20
+        lut = self._gamma_luts.get(gamma)
+        if lut is None:
+            lut = self._gamma_luts[gamma] = gamma_lut(gamma)
+        return apply_gamma_distortion(image, gamma, lut)
 
     def add_complex_background(self, image):
         # Background complexity based on intensity
         complexity = int(self.settings.realism_intensity * 5)
         
-        bg = Image.new('RGB', image.size, "#FFFFFF")
-        draw = ImageDraw.Draw(bg)
-        
         # Add grid lines - more lines with higher complexity
         grid_size = 40 - (complexity * 6)
         if grid_size < 5:
             grid_size = 5
-            
-        for i in range(0, image.width, grid_size):
-            draw.line([(i, 0), (i, image.height)], fill="#EEEEEE")
-        for i in range(0, image.height, grid_size):
-            draw.line([(0, i), (image.width, i)], fill="#EEEEEE")
+        
+        bg = _grid_background(image.width, image.height, grid_size).copy()
         
         # Add noise for higher complexity levels
         if complexity > 2:
-            for _ in range(complexity * 10):
-                x = random.randint(0, image.width-1)
-                y = random.randint(0, image.height-1)
-                draw.point((x, y), fill="#DDDDDD")
+            n_points = complexity * 10
+            ys = np.random.randint(0, image.height, n_points)
+            xs = np.random.randint(0, image.width, n_points)
+            bg[ys, xs] = 0xDD
+        
+        bg = Image.fromarray(bg)
         
         # Composite label over background
         if image.mode == 'RGBA':
             bg.paste(image, (0, 0), image)
+            bg.putalpha(image.getchannel('A'))  # Keep the label transparency
         else:
             bg.paste(image, (0, 0))
         return bg
@@ -204,10 +290,89 @@ class RealismEnhancer:
         kernel_size = random.choice([1, max_kernel])
         
         operation = random.choice(['dilate', 'erode'])
+        if kernel_size == 1:
+            return image  # A 1x1 window leaves every pixel unchanged
+        
+        if grey_dilation is not None and image.mode in ('RGB', 'RGBA'):
+            # Separable morphology on the colour bands, alpha stays in place
+            arr = np.asarray(image)
+            morph = grey_dilation if operation == 'dilate' else grey_erosion
+            out = arr.copy()
+            out[:, :, :3] = morph(arr[:, :, :3], size=(kernel_size, kernel_size, 1))
+            return Image.fromarray(out)
+        
         if operation == 'dilate':
-            return image.filter(ImageFilter.MaxFilter(kernel_size))
+            rank_filter = ImageFilter.MaxFilter(kernel_size)
         else:
-            return image.filter(ImageFilter.MinFilter(kernel_size))
+            rank_filter = ImageFilter.MinFilter(kernel_size)
+        if image.mode == 'RGBA':
+            # Filter the colour bands only, alpha stays in place
+            filtered = image.convert('RGB').filter(rank_filter)
+            filtered.putalpha(image.getchannel('A'))
+            return filtered
+        return image.filter(rank_filter)
+
+
+class OrderedUniqueList(list):
+    """List without duplicates that keeps insertion order, membership is a set lookup"""
+    def __init__(self, items=()):
+        super().__init__(dict.fromkeys(items))
+        self._members = set(self)
+        
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+        
+    def __contains__(self, item):
+        return item in self._members
+        
+    def index(self, item, *args):
+        if item not in self._members:
+            raise ValueError(f"{item!r} is not in list")
+        return super().index(item, *args)
+        
+    def append(self, item):
+        if item not in self._members:
+            super().append(item)
+            self._members.add(item)
+            
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+            
+    def remove(self, item):
+        if item not in self._members:
+            raise ValueError(f"{item!r} is not in list")
+        super().remove(item)
+        self._members.discard(item)
+        
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._members = set(self)
+        if len(self._members) != len(self):
+            # Drop any duplicate the assignment introduced
+            super().__setitem__(slice(None), list(dict.fromkeys(self)))
+        
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._members = set(self)
+        
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+        
+    def insert(self, index, item):
+        if item not in self._members:
+            super().insert(index, item)
+            self._members.add(item)
+            
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._members.discard(item)
+        return item
+        
+    def clear(self):
+        super().clear()
+        self._members.clear()
 
 
 class LabelGeneratorSettings:
@@ -277,6 +442,23 @@ class LabelGeneratorSettings:
         
         # Initialize calculated properties
         self.update_calculated_properties()
+        
+    # Font and color choices are unique, kept as OrderedUniqueList whatever is assigned
+    @property
+    def font_families(self):
+        return self._font_families
+    
+    @font_families.setter
+    def font_families(self, fonts):
+        self._font_families = OrderedUniqueList(fonts)
+        
+    @property
+    def text_colors(self):
+        return self._text_colors
+    
+    @text_colors.setter
+    def text_colors(self, colors):
+        self._text_colors = OrderedUniqueList(colors)
 
     def update_calculated_properties(self):
         """Update calculated properties based on current settings"""
@@ -294,46 +476,108 @@ class LabelGeneratorSettings:
             
     def get_safe_fonts(self):
         """Get list of safe fonts that can render basic text"""
-        system_fonts = fm.findSystemFonts()
-        safe_fonts = []
-        for fpath in system_fonts:
-            try:
-                font = fm.get_font(fpath)
-                if font.style.find('Regular') != -1 and font.variant.find('normal') != -1:
-                    safe_fonts.append(font.name)
-            except:
-                continue
-        return list(set(safe_fonts)) + ['DejaVu Sans', 'Arial', 'Verdana', 'Times New Roman']
+        return list(_safe_fonts())
     
     def generate_light_background(self):
         """Generate a light background color with guaranteed brightness"""
-        # Generate random color in HSV space
-        h = random.random()
-        s = random.uniform(0.0, 0.3)  # Low saturation = pastel
-        v = random.uniform(self.min_background_brightness, 1.0)
+        rng = np.random.default_rng(random.getrandbits(32))
+        return self.generate_light_backgrounds(1, rng)[0]
+    
+    def generate_light_backgrounds(self, n, rng):
+        """Generate n light background colors in one vectorized HSV to RGB pass"""
+        # Random colors in HSV space, low saturation = pastel
+        hsv = rng.uniform([0.0, 0.0, self.min_background_brightness], [1.0, 0.3, 1.0], (n, 3))
+        rgb = (hsv_to_rgb(hsv) * 255).astype(np.uint8)
+        return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()]
+
+
+METADATA_FIELDS = [
+    "label_id", "image_filename", "text", "rotation_angle", "font_family", 
+    "font_size", "font_weight", "text_color", "background",
+    "vintage_applied", "vintage_intensity"
+]
+
+
+class MetadataWriter:
+    """Writes label metadata rows to the CSV and TXT files as they are generated"""
+    def __init__(self, output_dir):
+        self.csv_path = os.path.join(output_dir, "labels_metadata.csv")
+        self.txt_path = os.path.join(output_dir, "labels_metadata.txt")
         
-        # Convert to RGB
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        r, g, b = int(r * 255), int(g * 255), int(b * 255)
+        # CSV file (preserves Unicode)
+        # Large buffers, rows reach the disk in big writes and on close
+        self._csvfile = open(self.csv_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20)  # utf-8-sig for Excel
+        self._csv_writer = csv.DictWriter(self._csvfile, fieldnames=METADATA_FIELDS)
+        self._csv_writer.writeheader()
         
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # TXT file (plain-text with encoded notation)
+        try:
+            self._txtfile = open(self.txt_path, 'w', encoding='utf-8', buffering=1 << 20)
+        except OSError:
+            # Do not leave the CSV open, or a file with only its header behind
+            self._csvfile.close()
+            os.remove(self.csv_path)
+            raise
+        self._txtfile.write("\t".join(METADATA_FIELDS) + "\n")
+        
+    def write(self, row):
+        """Append one label's metadata to both files"""
+        self._csv_writer.writerow(row)
+        # Scientific notation is encoded in the TXT file only
+        encoded_row = dict(row, text=encode_scientific_notation(row['text']))
+        self._txtfile.write("\t".join(str(encoded_row[field]) for field in METADATA_FIELDS) + "\n")
+        
+    def close(self):
+        self._csvfile.close()
+        self._txtfile.close()
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 class LabelGenerator:
     """Handles the generation of label images based on settings"""
-    def __init__(self, settings):
+    def __init__(self, settings, seed=None):
         self.settings = settings
         self.settings.update_calculated_properties()
-        self.metadata = []
+        self.realism = RealismEnhancer(settings)
+        # Seed of the batch, shared with worker processes so they draw alike
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self._rand = self._prefetch_random(settings.num_labels)
+        # Text is measured on one shared canvas, metrics do not depend on its content
+        self._measure_canvas = Image.new('RGB', (100, 100))
+        self._measure_draw = ImageDraw.Draw(self._measure_canvas)
+        
+    def _prefetch_random(self, n):
+        """Pre-draw the per-label random choices of a batch of n labels"""
+        rng = np.random.default_rng(self.seed)
+        
+        def pick(options):
+            # n random choices from options (none when options is empty)
+            options = list(options)
+            if not options:
+                return []
+            return [options[i] for i in rng.integers(len(options), size=n)]
+        
+        variation = self.settings.font_size_variation
+        return SimpleNamespace(
+            size=n,
+            font_families=pick(self.settings.font_families),
+            font_size_offsets=rng.integers(-variation, variation + 1, size=n).tolist(),
+            font_weights=pick(self.settings.font_weights),
+            text_colors=pick(self.settings.text_colors),
+            transparent_probs=rng.random(n).tolist(),
+            vintage_probs=rng.random((n, 5)).tolist(),
+            realism_probs=rng.random((n, 6)).tolist(),
+            backgrounds=self.settings.generate_light_backgrounds(n, rng)
+        )
         
     def to_superscript(self, num):
         """Convert numbers to Unicode superscript characters"""
-        superscript_map = {
-            '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
-            '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-            '-': '⁻', '+': '⁺'
-        }
-        return ''.join(superscript_map.get(char, char) for char in str(num))
+        return str(num).translate(_ASCII_TO_SUPER)
 
     def generate_label_text(self):
         """Generate label text with proper scientific notation"""
@@ -390,15 +634,17 @@ class LabelGenerator:
         else:
             return int(angle_type)
 
-    def apply_vintage_effects(self, image, intensity=0.7):
-        """Apply vintage effects to label images"""
+    def apply_vintage_effects(self, image, intensity=0.7, gates=None):
+        """Apply vintage effects to label images, optionally with four pre-drawn gates"""
+        if gates is None:
+            gates = [random.random() for _ in range(4)]
         try:
-            if random.random() < 0.8:
+            if gates[0] < 0.8:
                 image = image.filter(ImageFilter.GaussianBlur(
                     radius=self.settings.blur_intensity * intensity
                 ))
             
-            if random.random() < 0.6:
+            if gates[1] < 0.6:
                 try:
                     texture = Image.open(self.settings.texture_file).convert('L')
                     texture = texture.resize(image.size)
@@ -406,19 +652,17 @@ class LabelGenerator:
                 except:
                     pass
             
-            if random.random() < 0.7:
-                sepia_filter = (
-                    0.393 + 0.1*intensity, 0.769, 0.189, 0,
-                    0.349, 0.686 + 0.1*intensity, 0.168, 0,
-                    0.272, 0.534, 0.131 + 0.1*intensity, 0
-                )
-                image = image.convert('RGB', matrix=sepia_filter)
+            if gates[2] < 0.7:
+                image.load()  # Convert from the decoded pixel buffer
+                image = image.convert('RGB', matrix=sepia_matrix(round(intensity, 2)))
             
-            if random.random() < 0.5:
-                arr = np.array(image).astype(np.float32)
-                noise = np.random.normal(0, 20*intensity, arr.shape)
-                noisy = np.clip(arr + noise, 0, 255).astype(np.uint8)
-                image = Image.fromarray(noisy)
+            if gates[3] < 0.5:
+                # int16 holds uint8 plus noise without overflow, work in place
+                noisy = np.asarray(image, dtype=np.int16)  # Widened straight from the pixel buffer
+                noise = np.random.normal(0, 20*intensity, noisy.shape).astype(np.int16)
+                np.add(noisy, noise, out=noisy)
+                np.clip(noisy, 0, 255, out=noisy)
+                image = Image.fromarray(noisy.astype(np.uint8))
             
             enhancer = ImageEnhance.Brightness(image)
             return enhancer.enhance(1 - 0.2*intensity)
@@ -437,33 +681,28 @@ class LabelGenerator:
         # Determine rotation angle
         rotation_angle = self.determine_rotation_angle()
     
+        # Per-label draws from the pre-fetched batch
+        if label_idx > self._rand.size:
+            self._rand = self._prefetch_random(max(label_idx, 2 * self._rand.size))
+        rand = self._rand
+        i = label_idx - 1
+    
         # Select random font properties
-        font_family = random.choice(self.settings.font_families)
-        font_size = self.settings.base_font_size + random.randint(
-            -self.settings.font_size_variation, 
-            self.settings.font_size_variation
-        )
-        font_weight = random.choice(self.settings.font_weights)
-        text_color = random.choice(self.settings.text_colors)
+        font_family = rand.font_families[i]
+        font_size = self.settings.base_font_size + rand.font_size_offsets[i]
+        font_weight = rand.font_weights[i]
+        text_color = rand.text_colors[i]
     
         # Always generate a background color (needed for rotation, JPG conversion, etc.)
-        generated_bg_color = self.settings.generate_light_background()
+        generated_bg_color = rand.backgrounds[i]
     
         # Determine if we use transparent background
-        use_transparent_bg = random.random() < self.settings.transparent_bg_prob
+        use_transparent_bg = rand.transparent_probs[i] < self.settings.transparent_bg_prob
     
-        # Create temporary image for text measurement
-        # ALWAYS use RGB for measurement to avoid alpha channel issues
-        temp_img = Image.new('RGB', (100, 100), generated_bg_color)
-        draw = ImageDraw.Draw(temp_img)
+        # Measure on the shared RGB canvas to avoid alpha channel issues
+        draw = self._measure_draw
     
-        try:
-            font = ImageFont.truetype(font_family, font_size)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+        font = _load_font(font_family, font_size)
     
         # Get text bounding box
         try:
@@ -480,37 +719,34 @@ class LabelGenerator:
         canvas_width = text_width + 2 * padding
         canvas_height = text_height + 2 * padding
     
-        # Create canvas - MODE CONSISTENCY FIX
-        if use_transparent_bg:
-            # RGBA mode for transparent background
-            canvas = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
-        else:
-            # RGB mode for colored background
-            canvas = Image.new('RGB', (canvas_width, canvas_height), generated_bg_color)
-    
+        canvas_size = (canvas_width, canvas_height)
         if self.settings.customized_size_resolution:
             # Determine target dimensions
             target_width = self.settings.image_width
             target_height = self.settings.image_height
         
-            # Resize canvas while maintaining aspect ratio
-            canvas_aspect = canvas.width / canvas.height
+            # Fit canvas to target while maintaining aspect ratio
+            canvas_aspect = canvas_width / canvas_height
             target_aspect = target_width / target_height
         
             if canvas_aspect > target_aspect:
                 # Canvas is wider than target
                 new_height = int(target_width / canvas_aspect)
-                new_size = (target_width, new_height)
+                canvas_size = (target_width, new_height)
             else:
                 # Canvas is taller than target
                 new_width = int(target_height * canvas_aspect)
-                new_size = (new_width, target_height)
-        
-            # Resize with high-quality Lanczos filtering
-            # Convert to RGBA temporarily for resizing if needed
-            if use_transparent_bg and canvas.mode != 'RGBA':
-                canvas = canvas.convert('RGBA')
-            canvas = canvas.resize(new_size, Image.Resampling.LANCZOS)
+                canvas_size = (new_width, target_height)
+    
+        # Create canvas directly at its final size - MODE CONSISTENCY FIX
+        # Text is drawn afterwards, so resampling the blank canvas would only
+        # reproduce the background and the rotation stays the single resample
+        if use_transparent_bg:
+            # RGBA mode for transparent background
+            canvas = Image.new('RGBA', canvas_size, (0, 0, 0, 0))
+        else:
+            # RGB mode for colored background
+            canvas = Image.new('RGB', canvas_size, generated_bg_color)
     
         # Create drawing context
         draw = ImageDraw.Draw(canvas)
@@ -524,10 +760,7 @@ class LabelGenerator:
         if use_transparent_bg:
             # Ensure text color is in RGBA format
             if text_color.startswith('#'):
-                r = int(text_color[1:3], 16)
-                g = int(text_color[3:5], 16)
-                b = int(text_color[5:7], 16)
-                text_color_tuple = (r, g, b, 255)  # Full opacity
+                text_color_tuple = hex_to_rgb(text_color) + (255,)  # Full opacity
             else:
                 # Default to black if parsing fails
                 text_color_tuple = (0, 0, 0, 255)
@@ -538,70 +771,40 @@ class LabelGenerator:
     
         # Apply rotation to the entire canvas - ROBUST FIX
         if rotation_angle != 0:
-            # Calculate expansion size for rotation
-            diagonal = int(np.sqrt(canvas_width**2 + canvas_height**2))
-            expand_size = max(canvas_width, canvas_height, diagonal) + padding
-        
-            # Create expanded canvas with same mode as original
-            if use_transparent_bg:
-                expanded_canvas = Image.new('RGBA', (expand_size, expand_size), (0, 0, 0, 0))
-            else:
-                expanded_canvas = Image.new('RGB', (expand_size, expand_size), generated_bg_color)
-        
-            # Paste original canvas at center of expanded canvas
-            paste_x = (expand_size - canvas_width) // 2
-            paste_y = (expand_size - canvas_height) // 2
-            expanded_canvas.paste(canvas, (paste_x, paste_y))
-        
             # Define fillcolor for rotation - handle both modes
             if use_transparent_bg:
                 fillcolor = (0, 0, 0, 0)  # Transparent for RGBA
             else:
                 # Convert hex to RGB tuple
                 if generated_bg_color.startswith('#'):
-                    r = int(generated_bg_color[1:3], 16)
-                    g = int(generated_bg_color[3:5], 16)
-                    b = int(generated_bg_color[5:7], 16)
-                    fillcolor = (r, g, b)
+                    fillcolor = hex_to_rgb(generated_bg_color)
                 else:
                     fillcolor = (255, 255, 255)  # Default to white
         
-            # Rotate the expanded canvas
-            expanded_canvas = expanded_canvas.rotate(
-                rotation_angle, 
-                expand=False,
-                fillcolor=fillcolor
-            )
-        
-            # Crop to content
-            bbox = expanded_canvas.getbbox()
-            if bbox:
-                canvas = expanded_canvas.crop(bbox)
-            else:
-                canvas = expanded_canvas
+            # expand=True sizes the result to the rotated bounds
+            canvas = canvas.rotate(rotation_angle, expand=True, fillcolor=fillcolor)
+            
+            # Crop transparent labels to their content, dropping the see-through corners
+            if use_transparent_bg:
+                bbox = canvas.getbbox()
+                if bbox:
+                    canvas = canvas.crop(bbox)
     
         # Apply vintage effects - MODE-AWARE VERSION
-        apply_vintage = random.random() < self.settings.vintage_effect_prob
+        apply_vintage = rand.vintage_probs[i][0] < self.settings.vintage_effect_prob
         if apply_vintage:
-            # Store original mode for transparent images
-            original_mode = canvas.mode
-        
-            # If image is RGBA (transparent), convert to RGB for vintage effects
-            # then convert back to RGBA with alpha channel
-            if original_mode == 'RGBA':
-                # Separate alpha channel
-                r, g, b, a = canvas.split()
-                rgb_canvas = Image.merge('RGB', (r, g, b))
-            
-                # Apply vintage effects to RGB version
-                rgb_canvas = self.apply_vintage_effects(rgb_canvas, self.settings.vintage_intensity)
-            
-                # Merge back with original alpha
-                r2, g2, b2 = rgb_canvas.split()
-                canvas = Image.merge('RGBA', (r2, g2, b2, a))
+            # Vintage effects work on RGB, transparent labels get their alpha back
+            if canvas.mode == 'RGBA':
+                alpha = canvas.getchannel('A')
+                canvas = self.apply_vintage_effects(
+                    canvas.convert('RGB'), self.settings.vintage_intensity, rand.vintage_probs[i][1:]
+                )
+                canvas.putalpha(alpha)
             else:
                 # Apply normally for RGB images
-                canvas = self.apply_vintage_effects(canvas, self.settings.vintage_intensity)
+                canvas = self.apply_vintage_effects(
+                    canvas, self.settings.vintage_intensity, rand.vintage_probs[i][1:]
+                )
   
         # Prepare metadata
         metadata = {
@@ -619,9 +822,8 @@ class LabelGenerator:
     
         # Apply realism effects if enabled
         if self.settings.add_realism:
-            realism = RealismEnhancer(self.settings)
             # Handle realism effects for both transparent and non-transparent backgrounds
-            canvas = realism.apply_mode_aware(canvas.copy(), use_transparent_bg)
+            canvas = self.realism.apply(canvas, rand.realism_probs[i])
     
         return canvas, metadata
 
@@ -630,88 +832,116 @@ class LabelGenerator:
 ##########################################################################################################    
     
     
-    def save_metadata(self):
-        """Save metadata to both CSV and TXT files"""
-        # CSV file (preserves Unicode)
-        csv_path = os.path.join(self.settings.output_dir, "labels_metadata.csv")
-        fieldnames = [
-            "label_id", "image_filename", "text", "rotation_angle", "font_family", 
-            "font_size", "font_weight", "text_color", "background",
-            "vintage_applied", "vintage_intensity"
-        ]
+    def encode_label(self, image):
+        """Encode a label image to bytes in the configured output format"""
+        output_format = self.settings.output_format.lower()
+        
+        # Determine DPI based on settings
+        if self.settings.customized_size_resolution:
+            dpi = random.randint(self.settings.min_dpi, self.settings.max_dpi)
+        else:
+            dpi = self.settings.fixed_dpi
         
-        with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:  # utf-8-sig for Excel
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.metadata)
+        # Set save parameters
+        save_params = {}
         
-        # TXT file (plain-text with encoded notation)
-        txt_path = os.path.join(self.settings.output_dir, "labels_metadata.txt")
-        with open(txt_path, 'w', encoding='utf-8') as txtfile:
-            # Write header
-            headers = "\t".join(fieldnames)
-            txtfile.write(f"{headers}\n")
-            
-            # Write each row with scientific notation encoding
-            for row in self.metadata:
-                encoded_row = row.copy()
-                encoded_row['text'] = encode_scientific_notation(row['text'])
-                line = "\t".join(str(encoded_row[field]) for field in fieldnames)
-                txtfile.write(f"{line}\n")
+        # Add DPI information for supported formats
+        if output_format in ['png', 'jpg', 'jpeg', 'tiff']:
+            save_params['dpi'] = (dpi, dpi)
         
-        return csv_path, txt_path
+        # Convert to RGB if saving as JPG
+        if output_format in ['jpg', 'jpeg']:
+            if image.mode in ['RGBA', 'LA']:
+                # Only transparent labels carry alpha, flatten them onto white
+                background = Image.new('RGB', image.size, "#FFFFFF")
+                background.paste(image, mask=image.getchannel('A'))
+                image = background
+            save_params['quality'] = 95
+        
+        # libvips encodes PNG and JPEG faster than PIL when it is installed
+        if (pyvips is not None and output_format in ('png', 'jpg', 'jpeg')
+                and image.mode in ('L', 'RGB', 'RGBA')):
+            return vips_encode(image, output_format, dpi)
+        
+        buffer = io.BytesIO()
+        image_format = Image.registered_extensions()['.' + output_format]
+        image.save(buffer, format=image_format, **save_params)
+        return buffer.getvalue()
+
+    def render_label(self, label_idx):
+        """Create and encode one label, seeding the RNGs from the label index"""
+        # Reproducible per label regardless of which worker renders it
+        random.seed(self.seed + label_idx)
+        np.random.seed((self.seed + label_idx) % 2**32)
+        
+        image, metadata = self.create_label_image(label_idx)
+        return self.encode_label(image), metadata
+
+    def render_labels(self, chunksize=32):
+        """
+        Render all labels in parallel worker processes
+        Yields (encoded image, metadata) in label order. Closing the generator
+        early cancels the labels the workers have not started yet.
+        """
+        # Workers are spawned, forking a process that runs Qt or other threads
+        # can copy locks into the child while they are held
+        executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.settings, self.seed)
+        )
+        try:
+            label_ids = range(1, self.settings.num_labels + 1)
+            yield from executor.map(_generate_one, label_ids, chunksize=chunksize)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def generate_all_labels(self):
-        """Generate all labels and save with metadata"""
+        """Generate all labels in parallel worker processes and save with metadata"""
         os.makedirs(self.settings.output_dir, exist_ok=True)
-        
-        for i in range(self.settings.num_labels):
-            label_idx = i + 1
-            image, metadata = self.create_label_image(label_idx)
-            
-            # Determine DPI based on settings
-            if self.settings.customized_size_resolution:
-                dpi = random.randint(self.settings.min_dpi, self.settings.max_dpi)
-            else:
-                dpi = self.settings.fixed_dpi
-            
-            # Save image
-            img_filename = f"label_270_{label_idx:03d}.{self.settings.output_format}"
-            img_path = os.path.join(self.settings.output_dir, img_filename)
-            
-            # Set save parameters
-            save_params = {}
-            
-            # Add DPI information for supported formats
-            if self.settings.output_format.lower() in ['png', 'jpg', 'jpeg', 'tiff']:
-                save_params['dpi'] = (dpi, dpi)
-            
-            # Convert to RGB if saving as JPG
-            if self.settings.output_format.lower() in ['jpg', 'jpeg']:
-                if image.mode in ['RGBA', 'LA']:
-                    # Use specified background color for JPG conversion
-                    bg_color = metadata['background']
-                    if bg_color == "transparent":
-                        bg_color = "#FFFFFF"  # Default to white for transparent
-                    background = Image.new('RGB', image.size, bg_color)
-                    background.paste(image, mask=image.split()[3] if image.mode == 'RGBA' else None)
-                    image = background
-                save_params['quality'] = 95    
+        # File paths are built by concatenation, the directory prefix is joined once
+        dir_prefix = os.path.join(self.settings.output_dir, '')
+        suffix = '.' + self.settings.output_format
+        
+        with MetadataWriter(self.settings.output_dir) as writer:
+            for blob, metadata in self.render_labels():
+                # Save image
+                img_filename = f"label_270_{metadata['label_id']:03d}{suffix}"
+                img_path = dir_prefix + img_filename
+                with open(img_path, 'wb') as img_file:
+                    img_file.write(blob)
                 
-            image.save(img_path, **save_params)
-            
-            # Add filename to metadata
-            metadata["image_filename"] = img_filename
-            self.metadata.append(metadata)
-            
-            print(f"Generated label: {img_filename}")
+                # Add filename to metadata and write its row right away
+                metadata["image_filename"] = img_filename
+                writer.write(metadata)
+                
+                print(f"Generated label: {img_filename}")
         
-        # Save metadata
-        csv_path, txt_path = self.save_metadata()
-        print(f"Metadata saved to: {csv_path} and {txt_path}")
+        print(f"Metadata saved to: {writer.csv_path} and {writer.txt_path}")
         print(f"Successfully generated {self.settings.num_labels} labels in '{self.settings.output_dir}'")
 
 
+# Label generator owned by each worker process of the pool
+_worker_generator = None
+
+
+def _init_worker(settings, seed):
+    """Create the label generator of a worker process"""
+    global _worker_generator
+    # Output of a worker goes to the console, not to streams the parent redirected
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    # Keep the target size drawn by the parent so every worker renders alike
+    size = (settings.image_width, settings.image_height)
+    _worker_generator = LabelGenerator(settings, seed)
+    settings.image_width, settings.image_height = size
+
+
+def _generate_one(label_idx):
+    """Render one label in a worker process, returning (encoded image, metadata)"""
+    return _worker_generator.render_label(label_idx)
+
+
 def main():
     """Entry point for command-line execution"""
     settings = LabelGeneratorSettings()
@@ -1,19 +1,235 @@
 import sys
 import os
 import json
-import matplotlib.pyplot as plt
-import random
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
-from PyQt6.QtGui import QIcon, QPixmap, QTextCursor
+import time
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import (
+    Qt, QObject, QSize, QThread, QTimer, pyqtSignal, QAbstractListModel, QModelIndex,
+    QRunnable, QThreadPool,
+    QItemSelection, QItemSelectionModel, QItemSelectionRange
+)
+from PyQt6.QtGui import QBrush, QIcon, QImage, QPalette, QPixmap, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QProgressBar, QSpinBox, QDoubleSpinBox, QLineEdit, QCheckBox,
-    QComboBox, QGroupBox, QListWidget, QListWidgetItem, QFileDialog, QMessageBox, QSplitter,
-    QDialog, QDialogButtonBox, QFormLayout, QScrollArea, QFrame, QTextEdit
+    QComboBox, QGroupBox, QListView, QListWidget, QListWidgetItem, QFileDialog, QMessageBox, QSplitter,
+    QDialog, QDialogButtonBox, QFormLayout, QColorDialog, QScrollArea, QFrame, QTextEdit
 )
 from PyQt6.QtGui import QColor 
 
-from label_generator_core import LabelGeneratorSettings, LabelGenerator 
+from label_generator_core import LabelGeneratorSettings, LabelGenerator, MetadataWriter
+
+
+# Preset text colors offered as swatch buttons, as (name, hex) pairs
+_PRESET_COLORS = (
+    ("Black", "#000000"),
+    ("Dark Gray", "#333333"),
+    ("Gray", "#666666"),
+    ("White", "#FFFFFF"),
+    ("Red", "#FF0000"),
+    ("Green", "#00FF00"),
+    ("Blue", "#0000FF"),
+    ("Dark Red", "#8B0000"),
+    ("Dark Green", "#006400"),
+    ("Dark Blue", "#00008B")
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_dark(hex_color):
+    """Check if a color is dark from its perceived luminance"""
+    color = QColor(hex_color)
+    if not color.isValid():
+        return True  # Default to dark if parsing fails
+    luminance = 0.2126 * color.redF() + 0.7152 * color.greenF() + 0.0722 * color.blueF()
+    return luminance < 0.5
+
+
+# Names shown for known text colors, keyed by uppercase hex
+COLOR_NAMES = {
+    "#000000": "Black",
+    "#333333": "Dark Gray",
+    "#555555": "Medium Gray",
+    "#777777": "Light Gray",
+    "#FFFFFF": "White",
+    "#FF0000": "Red",
+    "#00FF00": "Green",
+    "#0000FF": "Blue",
+    "#FFA500": "Orange",
+    "#800080": "Purple",
+    "#FFFF00": "Yellow",
+    "#00FFFF": "Cyan",
+    "#FF00FF": "Magenta",
+    "#A52A2A": "Brown"
+}
+
+# Darkness of the preset and named colors is known upfront, other colors are cached
+_KNOWN_HEXES = frozenset(color for _, color in _PRESET_COLORS) | frozenset(COLOR_NAMES)
+_DARK_HEXES = frozenset(color for color in _KNOWN_HEXES if _compute_dark(color))
+
+# Shared text brushes for color rows on dark and light swatches
+_FG_LIGHT = QBrush(QColor("white"))
+_FG_DARK = QBrush(QColor("black"))
+
+
+# Settings written to and read from settings files, image_width and
+# image_height are left out since they are recalculated on load
+_PERSISTED_FIELDS = (
+    'num_labels', 'output_format', 'output_dir',
+    'vintage_intensity', 'texture_file',
+    'customized_size_resolution', 'min_width', 'max_width', 'min_height', 'max_height',
+    'min_dpi', 'max_dpi', 'fixed_dpi',
+    'add_realism', 'realism_intensity',
+    'label_text_options', 'scientific_notation_prob',
+    'available_units', 'units', 'unit_separator',
+    'base_font_size', 'font_size_variation', 'font_families', 'font_weights', 'text_colors',
+    'min_background_brightness', 'transparent_bg_prob',
+    'rotation_allowed', 'rotation_angle_allowed', 'custom_angle_step',
+    'vintage_effect_prob', 'noise_intensity', 'blur_intensity',
+    'min_text_padding', 'allow_clipping', 'clipping_probability',
+)
+
+
+# Window and tab stylesheets, widgets are matched by object name so each
+# compiles one stylesheet instead of one per widget
+_MAIN_WINDOW_STYLE = """
+    QLabel#hint {
+        color: #666666;
+        font-style: italic;
+        font-size: 11px;
+    }
+"""
+_UNITS_TAB_STYLE = """
+    QPushButton#select-units-btn {
+        min-height: 40px;
+    }
+    QLineEdit#unit-action, QPushButton#unit-action {
+        min-height: 30px;
+    }
+"""
+
+_FONT_STYLE_TAB_STYLE = """
+    QLabel#preset-label {
+        font-weight: bold;
+    }
+    QPushButton#remove-color-btn {
+        min-height: 35px;
+    }
+    QLabel#color-preview {
+        border: 2px solid #666666;
+    }
+    QPushButton#preset-btn {
+        border: 1px solid #666666;
+        border-radius: 3px;
+    }
+    QPushButton#preset-btn:hover {
+        border: 2px solid #333333;
+    }
+""" + "".join(
+    f'QPushButton#preset-btn[preset_color="{color}"] {{ background-color: {color}; }}\n'
+    for _, color in _PRESET_COLORS
+)
+
+
+def uniform_list_widget():
+    """
+    Create a QListWidget for rows of equal height, laid out in batches
+    Row heights are then measured once instead of per row when scrolling.
+    """
+    list_widget = QListWidget()
+    list_widget.setUniformItemSizes(True)
+    list_widget.setLayoutMode(QListWidget.LayoutMode.Batched)
+    list_widget.setBatchSize(64)
+    return list_widget
+
+
+class StringListModel(QAbstractListModel):
+    """List model over a plain Python list of strings, without per-row items"""
+    def __init__(self, strings=None, parent=None):
+        super().__init__(parent)
+        self._data = list(strings or [])
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._data)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._data[index.row()]
+        return None
+    
+    def strings(self):
+        """Copy of the strings in row order"""
+        return list(self._data)
+    
+    def set_strings(self, strings):
+        """Replace every row at once"""
+        self.beginResetModel()
+        self._data = list(strings)
+        self.endResetModel()
+        
+    def append(self, text):
+        """Add one row at the end"""
+        row = len(self._data)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data.append(text)
+        self.endInsertRows()
+        
+    def remove_rows(self, rows):
+        """
+        Remove the given rows, last first so the others keep their index
+        Consecutive rows go in one removal, so views get one notification
+        per run instead of per row.
+        """
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._data[first:last + 1]
+            self.endRemoveRows()
+
+
+def uniform_list_view(model):
+    """Create a QListView over model with the settings of uniform_list_widget"""
+    list_view = QListView()
+    list_view.setUniformItemSizes(True)
+    list_view.setLayoutMode(QListView.LayoutMode.Batched)
+    list_view.setBatchSize(64)
+    list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+    list_view.setModel(model)
+    return list_view
+
+
+def selected_rows(list_view):
+    """Sorted row numbers selected in a QListView"""
+    return sorted(index.row() for index in list_view.selectionModel().selectedRows())
+
+
+def opaque_scroll_area():
+    """
+    Create a resizable QScrollArea that paints its whole area itself
+    Qt then skips clearing the background and, when resized, repainting the
+    viewport contents that stay in place.
+    """
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    scroll_area.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+    scroll_area.viewport().setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+    return scroll_area
+
+
+def iter_items(list_widget):
+    """Iterate over the items of a QListWidget in row order"""
+    return (list_widget.item(i) for i in range(list_widget.count()))
+
+
+def write_file(path, data):
+    """Write bytes to a file, used from the label writer threads"""
+    with open(path, 'wb') as f:
+        f.write(data)
 
 
 
@@ -21,9 +237,8 @@ class UnitSelectionDialog(QDialog):
     """Dialog for selecting allowed units from a list"""
     def __init__(self, parent=None, available_units=None, selected_units=None):
         super().__init__(parent)
-        self.available_units = available_units or []
-        self.selected_units = selected_units or []
         self.init_ui()
+        self.refresh(available_units, selected_units)
         
     def init_ui(self):
         self.setWindowTitle("Select Allowed Units")
@@ -40,17 +255,10 @@ class UnitSelectionDialog(QDialog):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         
-        self.unit_list = QListWidget()
+        self.unit_list = uniform_list_widget()
         self.unit_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
         self.unit_list.setMinimumHeight(400)  # Larger list
         
-        # Populate with available units
-        for unit in self.available_units:
-            item = QListWidgetItem(unit if unit != "" else "[No unit - empty string]")
-            self.unit_list.addItem(item)
-            if unit in self.selected_units:
-                item.setSelected(True)
-        
         scroll_area.setWidget(self.unit_list)
         layout.addWidget(scroll_area)
         
@@ -85,17 +293,37 @@ class UnitSelectionDialog(QDialog):
         layout.addWidget(button_box)
         self.setLayout(layout)
         
+    def refresh(self, available_units=None, selected_units=None):
+        """Show the given units, so the dialog can be reused across opens"""
+        self.available_units = available_units or []
+        self.selected_units = selected_units or []
+        self._selected_set = frozenset(self.selected_units)  # Membership tests when populating
+        self.warning_label.setVisible(False)
+        
+        # Populate with available units in one call, then select in one commit
+        self.unit_list.setUpdatesEnabled(False)
+        self.unit_list.blockSignals(True)
+        self.unit_list.clear()
+        self.unit_list.addItems(
+            [unit if unit != "" else "[No unit - empty string]" for unit in self.available_units]
+        )
+        model = self.unit_list.model()
+        selection = QItemSelection()
+        for row, unit in enumerate(self.available_units):
+            if unit in self._selected_set:
+                index = model.index(row, 0)
+                selection.append(QItemSelectionRange(index, index))
+        self.unit_list.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+        self.unit_list.blockSignals(False)
+        self.unit_list.setUpdatesEnabled(True)
+        
     def select_all(self):
         """Select all units in the list"""
-        for i in range(self.unit_list.count()):
-            item = self.unit_list.item(i)
-            item.setSelected(True)
+        self.unit_list.selectAll()
             
     def clear_all(self):
         """Clear all selections in the list"""
-        for i in range(self.unit_list.count()):
-            item = self.unit_list.item(i)
-            item.setSelected(False)
+        self.unit_list.clearSelection()
             
     def validate_and_accept(self):
         """Validate that at least one unit is selected before accepting"""
@@ -116,33 +344,160 @@ class UnitSelectionDialog(QDialog):
             if text == "[No unit - empty string]":
                 selected.append("")
             else:
-                selected.append(text)
+                selected.append(sys.intern(text))
         return selected
 
 
 # Create a stream that redirects console output to a QTextEdit
-class OutputStream:
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
-        
+class OutputStream(QObject):
+    """
+    Emits written text instead of touching the widget, so the generation
+    thread can print safely; the receiver appends it in the GUI thread.
+    """
+    text_ready = pyqtSignal(str)
+    
     def write(self, text):
-        cursor = self.text_widget.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(text)
-        self.text_widget.setTextCursor(cursor)
-        self.text_widget.ensureCursorVisible()
+        self.text_ready.emit(text)
         
     def flush(self):
         pass
 
 
+class FontLoaderSignals(QObject):
+    finished = pyqtSignal(list)
+
+
+class FontLoader(QRunnable):
+    """Lists the safe fonts in a pool thread, the result arrives as a signal"""
+    def __init__(self, settings):
+        super().__init__()
+        self.settings = settings
+        self.signals = FontLoaderSignals()
+        self.setAutoDelete(False)  # The tab keeps it, and with it the signals
+        
+    def run(self):
+        self.signals.finished.emit(self.settings.get_safe_fonts())
+
+
 class SettingsTab(QWidget):
     """Base class for settings tabs with common functionality"""
     def __init__(self, settings):
         super().__init__()
         self.settings = settings
+        self.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors, True)
+        self._message_box = None  # Created on the first message
+        # Values of a burst of spinbox changes, committed once it settles
+        self._pending = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self.flush_pending_settings)
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
+        self._initialized = False  # Widgets are built by init_ui on first show
+        self._bindings = []  # (spinbox, setting name) pairs refreshed by apply_settings
+        
+    def ensure_ui(self):
+        """Build the tab's widgets if that has not happened yet"""
+        if not self._initialized:
+            self._initialized = True
+            self.init_ui()
+            
+    def showEvent(self, event):
+        """Build the tab the first time it is shown"""
+        self.ensure_ui()
+        super().showEvent(event)
+        
+    def bind(self, spinbox, attr):
+        """Register a spinbox that shows the given setting"""
+        self._bindings.append((spinbox, attr))
+        
+    def apply_settings(self):
+        """Show the current settings in the tab's widgets without rebuilding them"""
+        if not self._initialized:
+            return  # Built from the current settings on first show
+        # Values held back from before the settings changed are stale
+        self._flush_timer.stop()
+        self._pending.clear()
+        for spinbox, attr in self._bindings:
+            spinbox.blockSignals(True)
+            spinbox.setValue(getattr(self.settings, attr))
+            spinbox.blockSignals(False)
+        self.apply_widget_settings()
+        
+    def apply_widget_settings(self):
+        """Update the widgets that are not bound spinboxes, tabs override this"""
+        
+    def schedule_setting(self, attr, value):
+        """Set a setting once the value has stopped changing for 50 ms"""
+        self._pending[attr] = value
+        self._flush_timer.start()
+        
+    def flush_pending_settings(self):
+        """Commit the scheduled setting values right away"""
+        self._flush_timer.stop()
+        for attr, value in self._pending.items():
+            setattr(self.settings, attr, value)
+        self._pending.clear()
+        
+    def show_message(self, icon, title, text, buttons=QMessageBox.StandardButton.Ok):
+        """Show a message in the tab's reusable message box, return the clicked button"""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+        box = self._message_box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        return QMessageBox.StandardButton(box.exec())
+        
+    def confirm(self, title, text, on_yes):
+        """Ask a yes/no question without blocking the event loop, on_yes runs on Yes"""
+        box = QMessageBox(QMessageBox.Icon.Question, title, text,
+                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(
+            lambda _: on_yes() if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes else None)
+        box.open()
+        
+    def show_status(self, text, timeout=2000):
+        """Show a short note in the main window's status bar, or in a message box without one"""
+        window = self.window()
+        if isinstance(window, QMainWindow):
+            window.statusBar().showMessage(text, timeout)
+        else:
+            self.show_message(QMessageBox.Icon.Information, "Note", text)
+            
+    def make_spinbox(self, attr, value_range, step=1, is_double=False):
+        """Create a spinbox bound to a setting, changes go through schedule_setting"""
+        box = QDoubleSpinBox() if is_double else QSpinBox()
+        box.setRange(*value_range)
+        box.setSingleStep(step)
+        box.setValue(getattr(self.settings, attr))
+        box.valueChanged.connect(lambda v: self.schedule_setting(attr, v))
+        self.bind(box, attr)
+        return box
+        
+    def add_spin_option(self, parent_layout, attr, label_text, comment_text, value_range, step):
+        """Add a labelled double spinbox with a comment below it, return the spinbox"""
+        container = QVBoxLayout()
+        container.setSpacing(3)  # Slightly increased spacing between control and comment
+        
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label_text))
+        box = self.make_spinbox(attr, value_range, step, is_double=True)
+        box.setMaximumWidth(80)  # Limit width
+        row.addWidget(box)
+        row.addStretch()
+        container.addLayout(row)
+        
+        comment = QLabel(comment_text)
+        comment.setObjectName("hint")
+        comment.setWordWrap(True)
+        container.addWidget(comment)
+        
+        parent_layout.addLayout(container)
+        return box
         
     def add_section(self, title):
         """Add a section header to the layout"""
@@ -173,9 +528,19 @@ class SettingsTab(QWidget):
 
 
 class UnitsOptionsSettingsTab(SettingsTab):
+    # Units offered in the selection dialog besides the custom ones, interned
+    # so the frequent membership tests compare identities first
+    _BASE_AVAILABLE_UNITS = tuple(sys.intern(unit) for unit in (
+        "", "  mg", "  mL", "  μg", "  μL", "  %", "  ppm", "  kelvin", "  M", 
+        " mM", " nM", " seconds", "  minutes", " hours", "  days", " (s)", 
+        "  (h)", " Celsius", "  Fahrenheit", "  Rankine", "meter", "liter", 
+        "(kg/L)", " m", " cm"
+    ))
+    
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
+        self.setStyleSheet(_UNITS_TAB_STYLE)
+        self._unit_dialog = None
         
     def init_ui(self):
         # Units section - occupies upper half
@@ -188,13 +553,13 @@ class UnitsOptionsSettingsTab(SettingsTab):
         selected_units_label = QLabel("Currently selected units:")
         unit_group_layout.addWidget(selected_units_label)
         
-        scroll_area_units = QScrollArea()
-        scroll_area_units.setWidgetResizable(True)
+        scroll_area_units = opaque_scroll_area()
         scroll_area_units.setMinimumHeight(120)
         scroll_area_units.setMaximumHeight(180)
         
-        self.selected_units_display = QListWidget()
-        self.selected_units_display.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.selected_units_model = StringListModel()
+        self.selected_units_display = uniform_list_view(self.selected_units_model)
+        self.selected_units_display.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.update_selected_units_display()
         
         scroll_area_units.setWidget(self.selected_units_display)
@@ -210,7 +575,7 @@ class UnitsOptionsSettingsTab(SettingsTab):
         
         self.select_units_btn = QPushButton("📋 Select Unit Options")
         self.select_units_btn.clicked.connect(self.open_unit_selection)
-        self.select_units_btn.setMinimumHeight(40)
+        self.select_units_btn.setObjectName("select-units-btn")
         
         unit_button_layout.addWidget(self.select_units_btn)
         unit_button_layout.addStretch()
@@ -222,15 +587,15 @@ class UnitsOptionsSettingsTab(SettingsTab):
         
         self.new_unit_edit = QLineEdit()
         self.new_unit_edit.setPlaceholderText("Enter custom unit (e.g., '  km')")
-        self.new_unit_edit.setMinimumHeight(30)
+        self.new_unit_edit.setObjectName("unit-action")
         
         self.add_unit_btn = QPushButton("➕ Add")
         self.add_unit_btn.clicked.connect(self.add_custom_unit)
-        self.add_unit_btn.setMinimumHeight(30)
+        self.add_unit_btn.setObjectName("unit-action")
         
         self.remove_custom_btn = QPushButton("🗑 Remove Selected")
         self.remove_custom_btn.clicked.connect(self.remove_custom_unit)
-        self.remove_custom_btn.setMinimumHeight(30)
+        self.remove_custom_btn.setObjectName("unit-action")
         
         custom_unit_layout.addWidget(QLabel("Custom Unit:"))
         custom_unit_layout.addWidget(self.new_unit_edit)
@@ -248,18 +613,14 @@ class UnitsOptionsSettingsTab(SettingsTab):
         sep_group_layout = QVBoxLayout()
         
         # Separator list with scroll area
-        scroll_area_sep = QScrollArea()
-        scroll_area_sep.setWidgetResizable(True)
+        scroll_area_sep = opaque_scroll_area()
         scroll_area_sep.setMinimumHeight(80)
         scroll_area_sep.setMaximumHeight(120)
         
-        self.separator_list = QListWidget()
-        self.separator_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        for sep in self.settings.unit_separator:
-            item = QListWidgetItem(sep)
-            self.separator_list.addItem(item)
-            item.setSelected(True)
-        self.separator_list.itemChanged.connect(self.update_separators)
+        self.separator_model = StringListModel(self.settings.unit_separator)
+        self.separator_list = uniform_list_view(self.separator_model)
+        self.separator_list.setSelectionMode(QListView.SelectionMode.MultiSelection)
+        self.separator_list.selectAll()
         
         scroll_area_sep.setWidget(self.separator_list)
         sep_group_layout.addWidget(scroll_area_sep)
@@ -284,32 +645,48 @@ class UnitsOptionsSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
+    def apply_widget_settings(self):
+        """Show the loaded units and separators"""
+        self.update_selected_units_display()
+        self.separator_model.set_strings(self.settings.unit_separator)
+        self.separator_list.selectAll()
+        
     def update_selected_units_display(self):
         """Update the display of selected units"""
-        self.selected_units_display.clear()
-        for unit in self.settings.units:
-            display_text = unit if unit != "" else "[No unit - empty string]"
-            self.selected_units_display.addItem(display_text)
-        # Update count label
+        self.selected_units_model.set_strings(
+            [unit if unit != "" else "[No unit - empty string]" for unit in self.settings.units]
+        )
+        self.update_units_count()
+        
+    def add_selected_unit_row(self, unit):
+        """Show one newly selected unit without rebuilding the display"""
+        self.selected_units_model.append(unit if unit != "" else "[No unit - empty string]")
+        self.update_units_count()
+        
+    def remove_selected_unit_rows(self, units):
+        """Drop the rows of the given units without rebuilding the display"""
+        display_texts = {unit if unit != "" else "[No unit - empty string]" for unit in units}
+        self.selected_units_model.remove_rows(
+            [row for row, text in enumerate(self.selected_units_model.strings()) if text in display_texts]
+        )
+        self.update_units_count()
+        
+    def update_units_count(self):
+        """Update count label"""
         if hasattr(self, 'units_count_label'):
             self.units_count_label.setText(f"Selected: {len(self.settings.units)} units")
             
     def open_unit_selection(self):
         """Open the unit selection dialog"""
-        # Get current available units (including custom ones)
-        available_units = [
-            "", "  mg", "  mL", "  μg", "  μL", "  %", "  ppm", "  kelvin", "  M", 
-            " mM", " nM", " seconds", "  minutes", " hours", "  days", " (s)", 
-            "  (h)", " Celsius", "  Fahrenheit", "  Rankine", "meter", "liter", 
-            "(kg/L)", " m", " cm"
-        ]
-        
-        # Add any custom units that aren't already in the list
-        for unit in self.settings.units:
-            if unit not in available_units and unit != "":
-                available_units.append(unit)
+        # Base units followed by any custom ones, deduplicated in order
+        available_units = list(dict.fromkeys((*self._BASE_AVAILABLE_UNITS, *self.settings.units)))
                 
-        dialog = UnitSelectionDialog(self, available_units, self.settings.units)
+        # The dialog is built on first use and refreshed afterwards
+        if self._unit_dialog is None:
+            self._unit_dialog = UnitSelectionDialog(self, available_units, self.settings.units)
+        else:
+            self._unit_dialog.refresh(available_units, self.settings.units)
+        dialog = self._unit_dialog
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Update the selected units
             selected_units = dialog.get_selected_units()
@@ -318,77 +695,67 @@ class UnitsOptionsSettingsTab(SettingsTab):
             
     def add_custom_unit(self):
         """Add a custom unit to the list"""
-        custom_unit = self.new_unit_edit.text().strip()
+        custom_unit = sys.intern(self.new_unit_edit.text().strip())
         if custom_unit:
             # Add to settings if not already present
             if custom_unit not in self.settings.units:
                 self.settings.units.append(custom_unit)
-                self.update_selected_units_display()
+                self.add_selected_unit_row(custom_unit)
                 self.new_unit_edit.clear()
             else:
-                QMessageBox.information(self, "Duplicate Unit", 
-                                      f"Unit '{custom_unit}' is already in the list.")
+                self.show_message(QMessageBox.Icon.Information, "Duplicate Unit", 
+                                  f"Unit '{custom_unit}' is already in the list.")
         else:
-            QMessageBox.warning(self, "Empty Unit", 
+            self.show_message(QMessageBox.Icon.Warning, "Empty Unit", 
                               "Please enter a unit name.")
                 
     def remove_custom_unit(self):
         """Remove selected custom unit from the list"""
-        selected_items = self.selected_units_display.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "No Selection", 
+        selected_texts = [
+            self.selected_units_model.strings()[row] for row in selected_rows(self.selected_units_display)
+        ]
+        if not selected_texts:
+            self.show_message(QMessageBox.Icon.Warning, "No Selection", 
                               "Please select a unit to remove.")
             return
             
         # Confirm removal
-        reply = QMessageBox.question(
-            self, "Confirm Removal",
-            f"Remove {len(selected_items)} selected unit(s)?",
+        reply = self.show_message(
+            QMessageBox.Icon.Question, "Confirm Removal",
+            f"Remove {len(selected_texts)} selected unit(s)?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            for item in selected_items:
-                display_text = item.text()
-                # Convert display text back to actual unit
-                if display_text == "[No unit - empty string]":
-                    unit = ""
-                else:
-                    unit = display_text
-                    
-                if unit in self.settings.units:
-                    self.settings.units.remove(unit)
-                    
-            self.update_selected_units_display()
+            # Convert display text back to actual units, then rebuild in one pass
+            to_remove = {
+                "" if text == "[No unit - empty string]" else text
+                for text in selected_texts
+            }
+            self.settings.units = [unit for unit in self.settings.units if unit not in to_remove]
+            self.remove_selected_unit_rows(to_remove)
             
     def update_separators(self):
         """Update selected separators in settings"""
-        selected = []
-        for i in range(self.separator_list.count()):
-            item = self.separator_list.item(i)
-            selected.append(item.text())
-        self.settings.unit_separator = selected
+        self.settings.unit_separator = self.separator_model.strings()
         
     def add_separator_item(self):
         """Add new separator item to the list"""
         sep = self.new_sep_edit.text().strip()
         if sep:
-            item = QListWidgetItem(sep)
-            self.separator_list.addItem(item)
+            self.separator_model.append(sep)
             self.new_sep_edit.clear()
             self.update_separators()
             
     def remove_separator_items(self):
         """Remove selected separator items from the list"""
-        for item in self.separator_list.selectedItems():
-            self.separator_list.takeItem(self.separator_list.row(item))
+        self.separator_model.remove_rows(selected_rows(self.separator_list))
         self.update_separators()
 
 
 class GeneralSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
         
     def init_ui(self):
         # Only keep Output Configuration section
@@ -400,6 +767,7 @@ class GeneralSettingsTab(SettingsTab):
         self.num_labels_spin.setValue(self.settings.num_labels)
         self.num_labels_spin.valueChanged.connect(
             lambda v: setattr(self.settings, 'num_labels', v))
+        self.bind(self.num_labels_spin, 'num_labels')
         self.add_setting("Number of labels:", self.num_labels_spin)
         
         # Output format
@@ -426,6 +794,15 @@ class GeneralSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
+    def apply_widget_settings(self):
+        """Show the loaded output format and directory"""
+        self.format_combo.blockSignals(True)
+        self.format_combo.setCurrentText(self.settings.output_format)
+        self.format_combo.blockSignals(False)
+        self.output_dir_edit.blockSignals(True)
+        self.output_dir_edit.setText(self.settings.output_dir)
+        self.output_dir_edit.blockSignals(False)
+        
     def browse_output_dir(self):
         """Open directory dialog for output path"""
         dir_path = QFileDialog.getExistingDirectory(
@@ -437,7 +814,6 @@ class GeneralSettingsTab(SettingsTab):
 class TextContentSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
         
     def init_ui(self):
         # Label text options - occupies upper half
@@ -447,18 +823,14 @@ class TextContentSettingsTab(SettingsTab):
         text_group_layout = QVBoxLayout()
         
         # Text list with scroll area
-        scroll_area_text = QScrollArea()
-        scroll_area_text.setWidgetResizable(True)
+        scroll_area_text = opaque_scroll_area()
         scroll_area_text.setMinimumHeight(200)  # Increased height
         scroll_area_text.setMaximumHeight(300)
         
-        self.text_list = QListWidget()
-        self.text_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        for text in self.settings.label_text_options:
-            item = QListWidgetItem(text)
-            self.text_list.addItem(item)
-            item.setSelected(True)
-        self.text_list.itemChanged.connect(self.update_text_options)
+        self.text_model = StringListModel(self.settings.label_text_options)
+        self.text_list = uniform_list_view(self.text_model)
+        self.text_list.setSelectionMode(QListView.SelectionMode.MultiSelection)
+        self.text_list.selectAll()
         
         scroll_area_text.setWidget(self.text_list)
         text_group_layout.addWidget(scroll_area_text)
@@ -495,6 +867,7 @@ class TextContentSettingsTab(SettingsTab):
         self.sci_prob_spin.setValue(self.settings.scientific_notation_prob)
         self.sci_prob_spin.valueChanged.connect(
             lambda v: setattr(self.settings, 'scientific_notation_prob', v))
+        self.bind(self.sci_prob_spin, 'scientific_notation_prob')
         sci_prob_layout.addWidget(self.sci_prob_spin)
         sci_prob_layout.addStretch()
         
@@ -512,34 +885,40 @@ class TextContentSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
+    def apply_widget_settings(self):
+        """Show the loaded label texts"""
+        self.text_model.set_strings(self.settings.label_text_options)
+        self.text_list.selectAll()
+        
     def update_text_options(self):
         """Update selected text options in settings"""
-        selected = []
-        for i in range(self.text_list.count()):
-            item = self.text_list.item(i)
-            selected.append(item.text())
-        self.settings.label_text_options = selected
+        self.settings.label_text_options = self.text_model.strings()
             
     def add_text_item(self):
         """Add new text item to the list"""
         text = self.new_text_edit.text().strip()
         if text:
-            item = QListWidgetItem(text)
-            self.text_list.addItem(item)
+            self.text_model.append(text)
             self.new_text_edit.clear()
             self.update_text_options()
             
     def remove_text_items(self):
         """Remove selected text items from the list"""
-        for item in self.text_list.selectedItems():
-            self.text_list.takeItem(self.text_list.row(item))
+        self.text_model.remove_rows(selected_rows(self.text_list))
         self.update_text_options()
 
 ###################################################################################################
 class FontStyleSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
+        self.setStyleSheet(_FONT_STYLE_TAB_STYLE)
+        self._swatch_cache = {}  # Swatch icons keyed by hex color
+        self._prefetched_fonts = None
+        
+        # Enumerate the system fonts in the background while other tabs are used
+        self._font_loader = FontLoader(settings)
+        self._font_loader.signals.finished.connect(self.populate_fonts)
+        QThreadPool.globalInstance().start(self._font_loader)
         
     def init_ui(self):
         # Font size settings - removed section title
@@ -551,6 +930,7 @@ class FontStyleSettingsTab(SettingsTab):
         self.font_size_spin.setValue(self.settings.base_font_size)
         self.font_size_spin.valueChanged.connect(
             lambda v: setattr(self.settings, 'base_font_size', v))
+        self.bind(self.font_size_spin, 'base_font_size')
         base_font_layout.addWidget(self.font_size_spin)
         base_font_layout.addStretch()
         self.layout.addLayout(base_font_layout)
@@ -563,6 +943,7 @@ class FontStyleSettingsTab(SettingsTab):
         self.font_var_spin.setValue(self.settings.font_size_variation)
         self.font_var_spin.valueChanged.connect(
             lambda v: setattr(self.settings, 'font_size_variation', v))
+        self.bind(self.font_var_spin, 'font_size_variation')
         font_var_layout.addWidget(self.font_var_spin)
         font_var_layout.addStretch()
         self.layout.addLayout(font_var_layout)
@@ -575,12 +956,13 @@ class FontStyleSettingsTab(SettingsTab):
         font_families_layout = QVBoxLayout()
         font_families_layout.setContentsMargins(5, 10, 5, 10)  # Tighter margins
         
-        self.font_list = QListWidget()
+        self.font_list = uniform_list_widget()
         self.font_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
         
         # Fixed height for font list - fits better in group
         self.font_list.setMinimumHeight(80)
         self.font_list.setMaximumHeight(120)
+        self.font_list.itemSelectionChanged.connect(self.update_font_families)
         
         font_families_layout.addWidget(self.font_list)
         font_families_group.setLayout(font_families_layout)
@@ -594,17 +976,16 @@ class FontStyleSettingsTab(SettingsTab):
         font_weights_layout = QVBoxLayout()
         font_weights_layout.setContentsMargins(5, 10, 5, 10)  # Tighter margins
         
-        self.weight_list = QListWidget()
+        self.weight_list = uniform_list_widget()
         self.weight_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
         
         # Fixed height for weight list - fits better in group
         self.weight_list.setMinimumHeight(80)
         self.weight_list.setMaximumHeight(120)
         
-        for weight in self.settings.font_weights:
-            item = QListWidgetItem(weight)
-            self.weight_list.addItem(item)
-            item.setSelected(True)
+        # All initial weights start selected
+        self.weight_list.addItems(list(self.settings.font_weights))
+        self.weight_list.selectAll()
         self.weight_list.itemSelectionChanged.connect(self.update_weights)
         
         font_weights_layout.addWidget(self.weight_list)
@@ -622,7 +1003,7 @@ class FontStyleSettingsTab(SettingsTab):
         # Left side: Color list (occupies half the width)
         left_layout = QVBoxLayout()
         
-        self.color_list = QListWidget()
+        self.color_list = uniform_list_widget()
         self.color_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.color_list.itemDoubleClicked.connect(self.pick_color)
         
@@ -651,13 +1032,15 @@ class FontStyleSettingsTab(SettingsTab):
         # Remove button
         self.remove_color_btn = QPushButton("🗑 Remove Selected")
         self.remove_color_btn.clicked.connect(self.remove_selected_color)
-        self.remove_color_btn.setMinimumHeight(35)
+        self.remove_color_btn.setObjectName("remove-color-btn")
         self.remove_color_btn.setMaximumWidth(150)  # Limit width
         
         # Preview of selected color
         self.color_preview = QLabel("")
         self.color_preview.setFixedSize(45, 35)  # Fixed size
-        self.color_preview.setStyleSheet("background-color: #000000; border: 2px solid #666666;")
+        self.color_preview.setObjectName("color-preview")
+        self.color_preview.setAutoFillBackground(True)
+        self.set_preview_color("#000000")
         
         controls_layout.addWidget(self.remove_color_btn)
         controls_layout.addWidget(self.color_preview)
@@ -671,7 +1054,7 @@ class FontStyleSettingsTab(SettingsTab):
         
         # Presets label
         preset_label = QLabel("Presets:")
-        preset_label.setStyleSheet("font-weight: bold;")
+        preset_label.setObjectName("preset-label")
         preset_container.addWidget(preset_label)
         
         # Preset colors in a grid (2 rows of 5) - right aligned
@@ -680,38 +1063,17 @@ class FontStyleSettingsTab(SettingsTab):
         preset_colors_grid.setHorizontalSpacing(8)  # Horizontal spacing between buttons
         preset_colors_grid.setVerticalSpacing(12)  # Vertical spacing between rows
         
-        preset_colors = [
-            ("Black", "#000000"),
-            ("Dark Gray", "#333333"),
-            ("Gray", "#666666"),
-            ("White", "#FFFFFF"),
-            ("Red", "#FF0000"),
-            ("Green", "#00FF00"),
-            ("Blue", "#0000FF"),
-            ("Dark Red", "#8B0000"),
-            ("Dark Green", "#006400"),
-            ("Dark Blue", "#00008B")
-        ]
-        
         # Distribute 5 colors per row
-        for i, (name, color) in enumerate(preset_colors):
+        for i, (name, color) in enumerate(_PRESET_COLORS):
             row = i // 5  # 0 for first 5, 1 for next 5
             col = i % 5   # 0-4 for columns
             
             btn = QPushButton("")
             btn.setToolTip(f"{name}: {color}")
             btn.setFixedSize(20, 20)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: 1px solid #666666;
-                    border-radius: 3px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #333333;
-                }}
-            """)
-            btn.clicked.connect(lambda checked, c=color: self.add_preset_color(c))
+            btn.setObjectName("preset-btn")
+            btn.setProperty("preset_color", color)  # Selects its background in the tab style
+            btn.clicked.connect(self.on_preset_clicked)
             preset_colors_grid.addWidget(btn, row, col)
         
         # Add the grid to a container for right alignment
@@ -748,84 +1110,77 @@ class FontStyleSettingsTab(SettingsTab):
         
     def is_dark_color(self, hex_color):
         """Check if a color is dark (for text contrast)"""
-        try:
-            # Remove # if present
-            hex_color = hex_color.lstrip('#')
-            
-            # Handle short hex format
-            if len(hex_color) == 3:
-                hex_color = ''.join([c*2 for c in hex_color])
-            
-            # Convert to RGB
-            r = int(hex_color[0:2], 16) / 255.0
-            g = int(hex_color[2:4], 16) / 255.0
-            b = int(hex_color[4:6], 16) / 255.0
-            
-            # Calculate luminance (perceived brightness)
-            luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-            
-            return luminance < 0.5
-        except:
-            return True  # Default to dark if parsing fails
+        key = hex_color.upper()
+        if key in _KNOWN_HEXES:
+            return key in _DARK_HEXES
+        return _compute_dark(hex_color)
             
+    def apply_widget_settings(self):
+        """Show the loaded colors, weights and font selection"""
+        self.update_color_display()
+        
+        self.weight_list.blockSignals(True)
+        self.weight_list.clear()
+        self.weight_list.addItems(list(self.settings.font_weights))
+        self.weight_list.selectAll()
+        self.weight_list.blockSignals(False)
+        
+        self.font_list.blockSignals(True)
+        for item in iter_items(self.font_list):
+            item.setSelected(item.text() in self.settings.font_families)
+        self.font_list.blockSignals(False)
+        
     def update_color_display(self):
         """Update the color list with visual swatches"""
+        self.color_list.setUpdatesEnabled(False)
+        self.color_list.blockSignals(True)
         self.color_list.clear()
         for color in self.settings.text_colors:
-            item = QListWidgetItem()
-            
-            # Create color swatch icon
+            self.color_list.addItem(self.make_color_item(color))
+        self.color_list.blockSignals(False)
+        self.color_list.setUpdatesEnabled(True)
+        
+    def make_color_item(self, color):
+        """Create the list row showing one color"""
+        item = QListWidgetItem()
+        self.configure_color_item(item, color)
+        return item
+    
+    def configure_color_item(self, item, color):
+        """Set swatch, name, contrast and data of a color row in place"""
+        # Color swatch icon, created once per color
+        icon = self._swatch_cache.get(color)
+        if icon is None:
             pixmap = QPixmap(24, 24)
             pixmap.fill(QColor(color))
+            icon = QIcon(pixmap)
+            self._swatch_cache[color] = icon
+        item.setIcon(icon)
+        
+        # Set text with color name if possible
+        color_name = self.get_color_name(color)
+        item.setText(f"{color_name} ({color})")
+        
+        # Set foreground color for contrast
+        item.setForeground(_FG_LIGHT if self.is_dark_color(color) else _FG_DARK)
             
-            # Set icon
-            item.setIcon(QIcon(pixmap))
-            
-            # Set text with color name if possible
-            color_name = self.get_color_name(color)
-            item.setText(f"{color_name} ({color})")
-            
-            # Set foreground color for contrast
-            if self.is_dark_color(color):
-                item.setForeground(Qt.GlobalColor.white)
-            else:
-                item.setForeground(Qt.GlobalColor.black)
-                
-            # Store the hex color in item data
-            item.setData(Qt.ItemDataRole.UserRole, color)
-            
-            self.color_list.addItem(item)
+        # Store the hex color in item data
+        item.setData(Qt.ItemDataRole.UserRole, color)
             
+    def set_preview_color(self, hex_color):
+        """Fill the preview through its palette, the stylesheet only draws the border"""
+        palette = self.color_preview.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(hex_color))
+        self.color_preview.setPalette(palette)
+        
     def get_color_name(self, hex_color):
         """Try to get a color name from hex value"""
-        color_names = {
-            "#000000": "Black",
-            "#333333": "Dark Gray",
-            "#555555": "Medium Gray",
-            "#777777": "Light Gray",
-            "#FFFFFF": "White",
-            "#FF0000": "Red",
-            "#00FF00": "Green",
-            "#0000FF": "Blue",
-            "#FFA500": "Orange",
-            "#800080": "Purple",
-            "#FFFF00": "Yellow",
-            "#00FFFF": "Cyan",
-            "#FF00FF": "Magenta",
-            "#A52A2A": "Brown"
-        }
-        
-        return color_names.get(hex_color.upper(), "Custom")
+        return COLOR_NAMES.get(hex_color.upper(), "Custom")
         
     def update_colors(self):
         """Update text colors in settings"""
-        colors = []
-        for i in range(self.color_list.count()):
-            item = self.color_list.item(i)
-            hex_color = item.data(Qt.ItemDataRole.UserRole)
-            if hex_color:
-                colors.append(hex_color)
-        self.settings.text_colors = colors
+        hex_colors = (item.data(Qt.ItemDataRole.UserRole) for item in iter_items(self.color_list))
+        self.settings.text_colors = [hex_color for hex_color in hex_colors if hex_color]
         
     def pick_color(self, item):
         """Open color picker dialog when double-clicking a color"""
@@ -848,61 +1203,64 @@ class FontStyleSettingsTab(SettingsTab):
             
             # Check if this color already exists (different from current)
             if hex_color != current_color and hex_color in self.settings.text_colors:
-                QMessageBox.information(self, "Duplicate Color", 
-                                      f"Color '{hex_color}' is already in the list.")
+                self.show_message(QMessageBox.Icon.Information, "Duplicate Color", 
+                                  f"Color '{hex_color}' is already in the list.")
                 return
             
             # Update the color in the list
             if hex_color != current_color:
-                # Replace the old color with new one
+                # Replace the old color with new one, only its row changes
                 idx = self.settings.text_colors.index(current_color)
                 self.settings.text_colors[idx] = hex_color
-            else:
-                # Just refresh display if same color
-                pass
-            
-            # Refresh display
-            self.update_color_display()
+                if current_color not in self.settings.text_colors:
+                    self._swatch_cache.pop(current_color, None)
+                self.configure_color_item(item, hex_color)
             
             # Update preview
-            self.color_preview.setStyleSheet(f"background-color: {hex_color}; border: 2px solid #666666;")
+            self.set_preview_color(hex_color)
             
+    def on_preset_clicked(self):
+        """Add the color stored on the clicked preset button"""
+        self.add_preset_color(self.sender().property("preset_color"))
+        
     def add_preset_color(self, hex_color):
         """Add a preset color when clicked"""
         if hex_color not in self.settings.text_colors:
             self.settings.text_colors.append(hex_color)
-            self.update_color_display()
+            self.color_list.addItem(self.make_color_item(hex_color))
             
             # Update preview with newly added color
-            self.color_preview.setStyleSheet(f"background-color: {hex_color}; border: 2px solid #666666;")
+            self.set_preview_color(hex_color)
         else:
-            QMessageBox.information(self, "Duplicate Color", 
-                                  f"Color '{hex_color}' is already in the list.")
+            self.show_status(f"Color '{hex_color}' is already in the list.")
                 
     def remove_selected_color(self):
         """Remove selected color from the list"""
         selected_items = self.color_list.selectedItems()
         if not selected_items:
-            QMessageBox.warning(self, "No Selection", 
+            self.show_message(QMessageBox.Icon.Warning, "No Selection", 
                               "Please select a color to remove.")
             return
             
-        # Confirm removal
-        reply = QMessageBox.question(
-            self, "Confirm Removal",
-            f"Remove {len(selected_items)} selected color(s)?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        # Confirm removal, the removal itself runs once the user answers
+        self.confirm("Confirm Removal", f"Remove {len(selected_items)} selected color(s)?",
+                     self.remove_color_items)
         
-        if reply == QMessageBox.StandardButton.Yes:
-            for item in selected_items:
-                hex_color = item.data(Qt.ItemDataRole.UserRole)
-                if hex_color and hex_color in self.settings.text_colors:
-                    self.settings.text_colors.remove(hex_color)
-                    
-            self.update_color_display()
-            # Reset preview to black
-            self.color_preview.setStyleSheet("background-color: #000000; border: 2px solid #666666;")
+    def remove_color_items(self):
+        """Remove the selected colors from the settings and their rows from the list"""
+        selected_items = self.color_list.selectedItems()
+        remove_set = {item.data(Qt.ItemDataRole.UserRole) for item in selected_items}
+        self.settings.text_colors = [c for c in self.settings.text_colors if c not in remove_set]
+        for hex_color in remove_set:
+            self._swatch_cache.pop(hex_color, None)
+            
+        # Only the selected rows leave the list, bottom up so rows stay valid
+        rows = sorted((self.color_list.row(item) for item in selected_items), reverse=True)
+        for row in rows:
+            self.color_list.takeItem(row)
+            
+        # Reset preview to black
+        self.set_preview_color("#000000")
             
     def update_font_families(self):
         """Update selected font families in settings"""
@@ -915,26 +1273,35 @@ class FontStyleSettingsTab(SettingsTab):
         self.settings.font_weights = selected
         
     def showEvent(self, event):
-        """Load font families when tab is shown"""
+        """Load font families when tab is shown, from the prefetch if it is done"""
         super().showEvent(event)
         if self.font_list.count() == 0:
-            self.load_font_families()
+            self.load_font_families(self._prefetched_fonts)
+            
+    def populate_fonts(self, fonts):
+        """Keep the prefetched fonts, fill the list now if the tab is already built"""
+        self._prefetched_fonts = fonts
+        if self._initialized and self.font_list.count() == 0:
+            self.load_font_families(fonts)
             
-    def load_font_families(self):
+    def load_font_families(self, fonts=None):
         """Load system font families into the list"""
+        if fonts is None:
+            fonts = self.settings.get_safe_fonts()
+        self.font_list.setUpdatesEnabled(False)
+        self.font_list.blockSignals(True)
         self.font_list.clear()
-        for font in self.settings.get_safe_fonts():
-            item = QListWidgetItem(font)
-            self.font_list.addItem(item)
-            # Select common fonts by default
-            if font in ['DejaVu Sans', 'Arial', 'Verdana', 'Times New Roman']:
-                item.setSelected(True)
-        self.font_list.itemSelectionChanged.connect(self.update_font_families)
+        self.font_list.addItems(fonts)
+        # Show the families in the settings, which may have been loaded while
+        # the fonts were still being listed
+        for item in iter_items(self.font_list):
+            item.setSelected(item.text() in self.settings.font_families)
+        self.font_list.blockSignals(False)
+        self.font_list.setUpdatesEnabled(True)
 ##############################################################################################################
 class VintageBackgroundSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
         
     def init_ui(self):
         # Combined Vintage Effects section (merging both previous sections)
@@ -943,59 +1310,17 @@ class VintageBackgroundSettingsTab(SettingsTab):
         vintage_layout.setSpacing(1)  # Increased spacing between option groups
         
         # Vintage effect probability with comment
-        vintage_prob_container = QVBoxLayout()
-        vintage_prob_container.setSpacing(3)  # Slightly increased spacing between control and comment
-        
-        vintage_prob_layout = QHBoxLayout()
-        vintage_prob_layout.addWidget(QLabel("Vintage effect probability (0.0-1.0):"))
-        self.vintage_prob_spin = QDoubleSpinBox()
-        self.vintage_prob_spin.setRange(0.0, 1.0)
-        self.vintage_prob_spin.setSingleStep(0.05)
-        self.vintage_prob_spin.setValue(self.settings.vintage_effect_prob)
-        self.vintage_prob_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'vintage_effect_prob', v))
-        self.vintage_prob_spin.setMaximumWidth(80)  # Limit width
-        vintage_prob_layout.addWidget(self.vintage_prob_spin)
-        vintage_prob_layout.addStretch()
-        
-        vintage_prob_container.addLayout(vintage_prob_layout)
-        
-        # Comment for vintage effect probability
-        vintage_prob_comment = QLabel("Probability that ANY vintage effects will be applied to a given label")
-        vintage_prob_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        vintage_prob_comment.setWordWrap(True)
-        vintage_prob_container.addWidget(vintage_prob_comment)
-        
-        vintage_layout.addLayout(vintage_prob_container)
+        self.vintage_prob_spin = self.add_spin_option(
+            vintage_layout, 'vintage_effect_prob', "Vintage effect probability (0.0-1.0):",
+            "Probability that ANY vintage effects will be applied to a given label", (0.0, 1.0), 0.05)
         
         # Add spacing between this option group and next
         vintage_layout.addSpacing(12)
         
         # Vintage intensity with comment
-        vintage_intensity_container = QVBoxLayout()
-        vintage_intensity_container.setSpacing(3)
-        
-        vintage_intensity_layout = QHBoxLayout()
-        vintage_intensity_layout.addWidget(QLabel("Vintage intensity (0.0-1.0):"))
-        self.vintage_intensity_spin = QDoubleSpinBox()
-        self.vintage_intensity_spin.setRange(0.0, 1.0)
-        self.vintage_intensity_spin.setSingleStep(0.1)
-        self.vintage_intensity_spin.setValue(self.settings.vintage_intensity)
-        self.vintage_intensity_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'vintage_intensity', v))
-        self.vintage_intensity_spin.setMaximumWidth(80)
-        vintage_intensity_layout.addWidget(self.vintage_intensity_spin)
-        vintage_intensity_layout.addStretch()
-        
-        vintage_intensity_container.addLayout(vintage_intensity_layout)
-        
-        # Comment for vintage intensity
-        vintage_intensity_comment = QLabel("Overall intensity multiplier for ALL vintage effects")
-        vintage_intensity_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        vintage_intensity_comment.setWordWrap(True)
-        vintage_intensity_container.addWidget(vintage_intensity_comment)
-        
-        vintage_layout.addLayout(vintage_intensity_container)
+        self.vintage_intensity_spin = self.add_spin_option(
+            vintage_layout, 'vintage_intensity', "Vintage intensity (0.0-1.0):",
+            "Overall intensity multiplier for ALL vintage effects", (0.0, 1.0), 0.1)
         
         # Add spacing
         vintage_layout.addSpacing(12)
@@ -1030,7 +1355,7 @@ class VintageBackgroundSettingsTab(SettingsTab):
         
         # Comment for texture file
         texture_comment = QLabel("The actual texture image used for the vintage effect")
-        texture_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
+        texture_comment.setObjectName("hint")
         texture_comment.setWordWrap(True)
         texture_container.addWidget(texture_comment)
         
@@ -1040,59 +1365,17 @@ class VintageBackgroundSettingsTab(SettingsTab):
         vintage_layout.addSpacing(12)
         
         # Noise intensity with comment
-        noise_container = QVBoxLayout()
-        noise_container.setSpacing(3)
-        
-        noise_layout = QHBoxLayout()
-        noise_layout.addWidget(QLabel("Noise intensity (0.0-1.0):"))
-        self.noise_spin = QDoubleSpinBox()
-        self.noise_spin.setRange(0.0, 1.0)
-        self.noise_spin.setSingleStep(0.05)
-        self.noise_spin.setValue(self.settings.noise_intensity)
-        self.noise_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'noise_intensity', v))
-        self.noise_spin.setMaximumWidth(80)
-        noise_layout.addWidget(self.noise_spin)
-        noise_layout.addStretch()
-        
-        noise_container.addLayout(noise_layout)
-        
-        # Comment for noise intensity
-        noise_comment = QLabel("Fine-tune how much random noise/grain to add")
-        noise_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        noise_comment.setWordWrap(True)
-        noise_container.addWidget(noise_comment)
-        
-        vintage_layout.addLayout(noise_container)
+        self.noise_spin = self.add_spin_option(
+            vintage_layout, 'noise_intensity', "Noise intensity (0.0-1.0):",
+            "Fine-tune how much random noise/grain to add", (0.0, 1.0), 0.05)
         
         # Add spacing
         vintage_layout.addSpacing(12)
         
         # Blur intensity with comment
-        blur_container = QVBoxLayout()
-        blur_container.setSpacing(3)
-        
-        blur_layout = QHBoxLayout()
-        blur_layout.addWidget(QLabel("Blur intensity (0.0-2.0):"))
-        self.blur_spin = QDoubleSpinBox()
-        self.blur_spin.setRange(0.0, 2.0)
-        self.blur_spin.setSingleStep(0.1)
-        self.blur_spin.setValue(self.settings.blur_intensity)
-        self.blur_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'blur_intensity', v))
-        self.blur_spin.setMaximumWidth(80)
-        blur_layout.addWidget(self.blur_spin)
-        blur_layout.addStretch()
-        
-        blur_container.addLayout(blur_layout)
-        
-        # Comment for blur intensity
-        blur_comment = QLabel("Fine-tune how much Gaussian blur to apply")
-        blur_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        blur_comment.setWordWrap(True)
-        blur_container.addWidget(blur_comment)
-        
-        vintage_layout.addLayout(blur_container)
+        self.blur_spin = self.add_spin_option(
+            vintage_layout, 'blur_intensity', "Blur intensity (0.0-2.0):",
+            "Fine-tune how much Gaussian blur to apply", (0.0, 2.0), 0.1)
         
         vintage_group.setLayout(vintage_layout)
         self.layout.addWidget(vintage_group)
@@ -1109,37 +1392,13 @@ class VintageBackgroundSettingsTab(SettingsTab):
         # Add realism checkbox
         self.realism_cb = QCheckBox("Add realism effects")
         self.realism_cb.setChecked(self.settings.add_realism)
-        self.realism_cb.stateChanged.connect(
-            lambda s: setattr(self.settings, 'add_realism', 
-                             s == Qt.CheckState.Checked.value))
-        self.realism_cb.stateChanged.connect(self.toggle_realism_options)
+        self.realism_cb.toggled.connect(self.on_realism_toggled)
         realism_layout.addWidget(self.realism_cb)
         
         # Realism intensity with comment
-        realism_intensity_container = QVBoxLayout()
-        realism_intensity_container.setSpacing(3)
-        
-        realism_intensity_layout = QHBoxLayout()
-        realism_intensity_layout.addWidget(QLabel("Realism intensity (0.0-1.0):"))
-        self.realism_intensity_spin = QDoubleSpinBox()
-        self.realism_intensity_spin.setRange(0.0, 1.0)
-        self.realism_intensity_spin.setSingleStep(0.1)
-        self.realism_intensity_spin.setValue(self.settings.realism_intensity)
-        self.realism_intensity_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'realism_intensity', v))
-        self.realism_intensity_spin.setMaximumWidth(80)
-        realism_intensity_layout.addWidget(self.realism_intensity_spin)
-        realism_intensity_layout.addStretch()
-        
-        realism_intensity_container.addLayout(realism_intensity_layout)
-        
-        # Comment for realism intensity
-        realism_comment = QLabel("Controls the strength of all realism enhancement effects")
-        realism_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        realism_comment.setWordWrap(True)
-        realism_intensity_container.addWidget(realism_comment)
-        
-        realism_layout.addLayout(realism_intensity_container)
+        self.realism_intensity_spin = self.add_spin_option(
+            realism_layout, 'realism_intensity', "Realism intensity (0.0-1.0):",
+            "Controls the strength of all realism enhancement effects", (0.0, 1.0), 0.1)
         realism_group.setLayout(realism_layout)
         self.layout.addWidget(realism_group)
         
@@ -1153,59 +1412,17 @@ class VintageBackgroundSettingsTab(SettingsTab):
         background_layout.setContentsMargins(10, 12, 10, 12)  # Reduced vertical padding
         
         # Background brightness with comment
-        bg_brightness_container = QVBoxLayout()
-        bg_brightness_container.setSpacing(3)
-        
-        bg_brightness_layout = QHBoxLayout()
-        bg_brightness_layout.addWidget(QLabel("Minimum background brightness (0.0-1.0):"))
-        self.bg_brightness_spin = QDoubleSpinBox()
-        self.bg_brightness_spin.setRange(0.0, 1.0)
-        self.bg_brightness_spin.setSingleStep(0.05)
-        self.bg_brightness_spin.setValue(self.settings.min_background_brightness)
-        self.bg_brightness_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'min_background_brightness', v))
-        self.bg_brightness_spin.setMaximumWidth(80)
-        bg_brightness_layout.addWidget(self.bg_brightness_spin)
-        bg_brightness_layout.addStretch()
-        
-        bg_brightness_container.addLayout(bg_brightness_layout)
-        
-        # Comment for background brightness
-        bg_brightness_comment = QLabel("How light the automatically generated backgrounds will be")
-        bg_brightness_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        bg_brightness_comment.setWordWrap(True)
-        bg_brightness_container.addWidget(bg_brightness_comment)
-        
-        background_layout.addLayout(bg_brightness_container)
+        self.bg_brightness_spin = self.add_spin_option(
+            background_layout, 'min_background_brightness', "Minimum background brightness (0.0-1.0):",
+            "How light the automatically generated backgrounds will be", (0.0, 1.0), 0.05)
         
         # Add spacing
         background_layout.addSpacing(12)
         
         # Transparent background probability with comment
-        transparent_prob_container = QVBoxLayout()
-        transparent_prob_container.setSpacing(3)
-        
-        transparent_prob_layout = QHBoxLayout()
-        transparent_prob_layout.addWidget(QLabel("Transparent background probability (0.0-1.0):"))
-        self.transparent_prob_spin = QDoubleSpinBox()
-        self.transparent_prob_spin.setRange(0.0, 1.0)
-        self.transparent_prob_spin.setSingleStep(0.05)
-        self.transparent_prob_spin.setValue(self.settings.transparent_bg_prob)
-        self.transparent_prob_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'transparent_bg_prob', v))
-        self.transparent_prob_spin.setMaximumWidth(80)
-        transparent_prob_layout.addWidget(self.transparent_prob_spin)
-        transparent_prob_layout.addStretch()
-        
-        transparent_prob_container.addLayout(transparent_prob_layout)
-        
-        # Comment for transparent background probability
-        transparent_prob_comment = QLabel("Chance that a label will have a transparent (no color) background")
-        transparent_prob_comment.setStyleSheet("color: #666666; font-style: italic; font-size: 11px;")
-        transparent_prob_comment.setWordWrap(True)
-        transparent_prob_container.addWidget(transparent_prob_comment)
-        
-        background_layout.addLayout(transparent_prob_container)
+        self.transparent_prob_spin = self.add_spin_option(
+            background_layout, 'transparent_bg_prob', "Transparent background probability (0.0-1.0):",
+            "Chance that a label will have a transparent (no color) background", (0.0, 1.0), 0.05)
         
         background_group.setLayout(background_layout)
         self.layout.addWidget(background_group)
@@ -1216,6 +1433,16 @@ class VintageBackgroundSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
+    def apply_widget_settings(self):
+        """Show the loaded texture file and realism switch"""
+        self.texture_edit.blockSignals(True)
+        self.texture_edit.setText(self.settings.texture_file)
+        self.texture_edit.blockSignals(False)
+        self.realism_cb.blockSignals(True)
+        self.realism_cb.setChecked(self.settings.add_realism)
+        self.realism_cb.blockSignals(False)
+        self.toggle_realism_options(self.settings.add_realism)
+        
     def browse_texture_file(self):
         """Open file dialog for texture file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1226,16 +1453,19 @@ class VintageBackgroundSettingsTab(SettingsTab):
         if file_path:
             self.texture_edit.setText(file_path)
             
-    def toggle_realism_options(self, state):
+    def on_realism_toggled(self, checked):
+        """Store the realism checkbox and update the dependent options"""
+        self.settings.add_realism = checked
+        self.toggle_realism_options(checked)
+        
+    def toggle_realism_options(self, enabled):
         """Enable/disable realism options based on checkbox state"""
-        enabled = state == Qt.CheckState.Checked.value
         self.realism_intensity_spin.setEnabled(enabled)
 ######################################################################################################################################################
 
 class RotationEffectsSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
         
     def init_ui(self):
         # Rotation settings
@@ -1244,20 +1474,13 @@ class RotationEffectsSettingsTab(SettingsTab):
         # Enable rotation checkbox
         self.rotation_cb = QCheckBox("Enable rotation")
         self.rotation_cb.setChecked(self.settings.rotation_allowed)
-        self.rotation_cb.stateChanged.connect(
-            lambda s: setattr(self.settings, 'rotation_allowed', 
-                             s == Qt.CheckState.Checked.value))
-        self.rotation_cb.stateChanged.connect(self.toggle_rotation_options)
+        self.rotation_cb.toggled.connect(self.on_rotation_toggled)
         self.layout.addWidget(self.rotation_cb)
         
         # Rotation angles
-        self.angle_list = QListWidget()
+        self.angle_list = uniform_list_widget()
         self.angle_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        for angle in self.settings.rotation_angle_allowed:
-            item = QListWidgetItem(angle)
-            self.angle_list.addItem(item)
-            if angle != 'customize':  # Select all except 'customize' by default
-                item.setSelected(True)
+        self.fill_angle_list()
         self.angle_list.itemSelectionChanged.connect(self.update_angles)
         
         angle_group = QGroupBox("Allowed Rotation Angles (select multiple)")
@@ -1273,6 +1496,7 @@ class RotationEffectsSettingsTab(SettingsTab):
         self.angle_step_spin.setValue(self.settings.custom_angle_step)
         self.angle_step_spin.valueChanged.connect(
             lambda v: setattr(self.settings, 'custom_angle_step', v))
+        self.bind(self.angle_step_spin, 'custom_angle_step')
         
         angle_step_layout = QHBoxLayout()
         angle_step_layout.addWidget(self.angle_step_label)
@@ -1286,9 +1510,32 @@ class RotationEffectsSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
-    def toggle_rotation_options(self, state):
+    def fill_angle_list(self):
+        """List the allowed rotation angles"""
+        self.angle_list.blockSignals(True)
+        self.angle_list.clear()
+        for angle in self.settings.rotation_angle_allowed:
+            item = QListWidgetItem(angle)
+            self.angle_list.addItem(item)
+            if angle != 'customize':  # Select all except 'customize' by default
+                item.setSelected(True)
+        self.angle_list.blockSignals(False)
+        
+    def apply_widget_settings(self):
+        """Show the loaded rotation switch and angles"""
+        self.rotation_cb.blockSignals(True)
+        self.rotation_cb.setChecked(self.settings.rotation_allowed)
+        self.rotation_cb.blockSignals(False)
+        self.fill_angle_list()
+        self.toggle_rotation_options(self.settings.rotation_allowed)
+        
+    def on_rotation_toggled(self, checked):
+        """Store the rotation checkbox and update the dependent options"""
+        self.settings.rotation_allowed = checked
+        self.toggle_rotation_options(checked)
+        
+    def toggle_rotation_options(self, enabled):
         """Enable/disable rotation options based on checkbox state"""
-        enabled = state == Qt.CheckState.Checked.value
         self.angle_list.setEnabled(enabled)
         self.angle_step_label.setEnabled(enabled)
         self.angle_step_spin.setEnabled(enabled)
@@ -1302,7 +1549,6 @@ class RotationEffectsSettingsTab(SettingsTab):
 class SizeResolutionSettingsTab(SettingsTab):
     def __init__(self, settings):
         super().__init__(settings)
-        self.init_ui()
         
     def init_ui(self):
         # Size configuration checkbox at the top
@@ -1310,10 +1556,7 @@ class SizeResolutionSettingsTab(SettingsTab):
         
         self.size_res_cb = QCheckBox("Customize size resolution")
         self.size_res_cb.setChecked(self.settings.customized_size_resolution)
-        self.size_res_cb.stateChanged.connect(
-            lambda s: setattr(self.settings, 'customized_size_resolution', 
-                             s == Qt.CheckState.Checked.value))
-        self.size_res_cb.stateChanged.connect(self.toggle_size_options)
+        self.size_res_cb.toggled.connect(self.on_size_toggled)
         self.layout.addWidget(self.size_res_cb)
         
         # Dimensions section (enabled when custom size is checked)
@@ -1321,17 +1564,9 @@ class SizeResolutionSettingsTab(SettingsTab):
         
         # Width range
         width_layout = QHBoxLayout()
-        self.min_width_spin = QSpinBox()
-        self.min_width_spin.setRange(50, 2000)
-        self.min_width_spin.setValue(self.settings.min_width)
-        self.min_width_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'min_width', v))
-        
-        self.max_width_spin = QSpinBox()
-        self.max_width_spin.setRange(50, 2000)
-        self.max_width_spin.setValue(self.settings.max_width)
-        self.max_width_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'max_width', v))
+        self.min_width_spin = self.make_spinbox('min_width', (50, 2000))
+        
+        self.max_width_spin = self.make_spinbox('max_width', (50, 2000))
         
         width_layout.addWidget(QLabel("Width range:"))
         width_layout.addWidget(QLabel("Min:"))
@@ -1343,17 +1578,9 @@ class SizeResolutionSettingsTab(SettingsTab):
         
         # Height range
         height_layout = QHBoxLayout()
-        self.min_height_spin = QSpinBox()
-        self.min_height_spin.setRange(50, 2000)
-        self.min_height_spin.setValue(self.settings.min_height)
-        self.min_height_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'min_height', v))
-        
-        self.max_height_spin = QSpinBox()
-        self.max_height_spin.setRange(50, 2000)
-        self.max_height_spin.setValue(self.settings.max_height)
-        self.max_height_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'max_height', v))
+        self.min_height_spin = self.make_spinbox('min_height', (50, 2000))
+        
+        self.max_height_spin = self.make_spinbox('max_height', (50, 2000))
         
         height_layout.addWidget(QLabel("Height range:"))
         height_layout.addWidget(QLabel("Min:"))
@@ -1368,17 +1595,9 @@ class SizeResolutionSettingsTab(SettingsTab):
         
         # DPI range (for custom size)
         dpi_range_layout = QHBoxLayout()
-        self.min_dpi_spin = QSpinBox()
-        self.min_dpi_spin.setRange(10, 600)
-        self.min_dpi_spin.setValue(self.settings.min_dpi)
-        self.min_dpi_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'min_dpi', v))
-        
-        self.max_dpi_spin = QSpinBox()
-        self.max_dpi_spin.setRange(10, 600)
-        self.max_dpi_spin.setValue(self.settings.max_dpi)
-        self.max_dpi_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'max_dpi', v))
+        self.min_dpi_spin = self.make_spinbox('min_dpi', (10, 600))
+        
+        self.max_dpi_spin = self.make_spinbox('max_dpi', (10, 600))
         
         dpi_range_layout.addWidget(QLabel("DPI range (custom size):"))
         dpi_range_layout.addWidget(QLabel("Min:"))
@@ -1390,11 +1609,7 @@ class SizeResolutionSettingsTab(SettingsTab):
         
         # Fixed DPI (for non-custom size)
         self.fixed_dpi_label = QLabel("Fixed DPI (non-custom size):")
-        self.fixed_dpi_spin = QSpinBox()
-        self.fixed_dpi_spin.setRange(10, 600)
-        self.fixed_dpi_spin.setValue(self.settings.fixed_dpi)
-        self.fixed_dpi_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'fixed_dpi', v))
+        self.fixed_dpi_spin = self.make_spinbox('fixed_dpi', (10, 600))
         
         fixed_dpi_layout = QHBoxLayout()
         fixed_dpi_layout.addWidget(self.fixed_dpi_label)
@@ -1406,11 +1621,7 @@ class SizeResolutionSettingsTab(SettingsTab):
         self.add_section("Layout Settings")
         
         # Text padding
-        self.padding_spin = QSpinBox()
-        self.padding_spin.setRange(0, 100)
-        self.padding_spin.setValue(self.settings.min_text_padding)
-        self.padding_spin.valueChanged.connect(
-            lambda v: setattr(self.settings, 'min_text_padding', v))
+        self.padding_spin = self.make_spinbox('min_text_padding', (0, 100))
         self.add_setting("Minimum text padding (pixels):", self.padding_spin)
         
         # Note about the clipping option (removed as requested)
@@ -1421,9 +1632,20 @@ class SizeResolutionSettingsTab(SettingsTab):
         # Add stretch to push content to top
         self.layout.addStretch()
         
-    def toggle_size_options(self, state):
+    def apply_widget_settings(self):
+        """Show the loaded size customization switch"""
+        self.size_res_cb.blockSignals(True)
+        self.size_res_cb.setChecked(self.settings.customized_size_resolution)
+        self.size_res_cb.blockSignals(False)
+        self.toggle_size_options(self.settings.customized_size_resolution)
+        
+    def on_size_toggled(self, checked):
+        """Store the size checkbox and update the dependent options"""
+        self.settings.customized_size_resolution = checked
+        self.toggle_size_options(checked)
+        
+    def toggle_size_options(self, enabled):
         """Enable/disable size options based on checkbox state"""
-        enabled = state == Qt.CheckState.Checked.value
         self.min_width_spin.setEnabled(enabled)
         self.max_width_spin.setEnabled(enabled)
         self.min_height_spin.setEnabled(enabled)
@@ -1436,83 +1658,112 @@ class SizeResolutionSettingsTab(SettingsTab):
 class GenerationThread(QThread):
     """Thread for running the label generation"""
     progress_updated = pyqtSignal(int, str)
-    image_generated = pyqtSignal(str)
+    image_generated = pyqtSignal(QImage)
     log_message = pyqtSignal(str)
     finished = pyqtSignal()
     
-    def __init__(self, settings):
+    def __init__(self, settings, preview_size=None):
         super().__init__()
         self.settings = settings
+        # Previews are decoded and scaled here so the GUI thread only shows them
+        self.preview_size = preview_size
         self.stopped = False
         
     def run(self):
-        """Run the generation process"""
-        generator = LabelGenerator(self.settings)
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(self.settings.output_dir, exist_ok=True)
-        
-        for i in range(self.settings.num_labels):
-            if self.stopped:
-                break
-                
-            label_idx = i + 1
-            self.progress_updated.emit(
-                int((i+1)/self.settings.num_labels*100), 
-                f"Generating label {label_idx}/{self.settings.num_labels}"
-            )
+        """Run the generation process, labels are rendered in worker processes"""
+        # Settings do not change during a run, read them once
+        num_labels = self.settings.num_labels
+        out_dir = self.settings.output_dir
+        out_fmt = self.settings.output_format
+        # File paths are built by concatenation, the directory prefix is joined once
+        dir_prefix = os.path.join(out_dir, '')
+        suffix = '.' + out_fmt
+        
+        # Files are written in background threads while the next labels arrive,
+        # at most max_writes are in flight
+        writer = ThreadPoolExecutor(max_workers=min(4, os.cpu_count()))
+        writes = deque()
+        max_writes = 4
+        # Progress is reported per percent or every 50 ms, previews about 20 times a run
+        last_pct, last_time = -1, 0.0
+        preview_every = max(1, num_labels // 20)
+        saved = 0
+        labels = None
+        # An exception escaping run() aborts the application, so errors are
+        # logged and the worker processes and writer threads are always released
+        try:
+            generator = LabelGenerator(self.settings)
             
-            # Create label image
-            image, metadata = generator.create_label_image(label_idx)
+            # Create output directory if it doesn't exist
+            os.makedirs(out_dir, exist_ok=True)
             
-            # Determine DPI based on settings
-            if self.settings.customized_size_resolution:
-                dpi = random.randint(self.settings.min_dpi, self.settings.max_dpi)
+            # Metadata rows are written as labels arrive, a stop keeps the rows so far
+            with MetadataWriter(out_dir) as metadata_writer:
+                # Small chunks so results stream back steadily and a stop takes effect quickly
+                labels = generator.render_labels(chunksize=8)
+                for done, (blob, metadata) in enumerate(labels, 1):
+                    if self.stopped:
+                        break
+                    
+                    label_idx = metadata['label_id']
+                    pct = done * 100 // num_labels
+                    now = time.monotonic()
+                    if pct != last_pct or now - last_time > 0.05:
+                        self.progress_updated.emit(pct, f"Generating label {done}/{num_labels}")
+                        last_pct, last_time = pct, now
+                    
+                    # Save image
+                    img_filename = f"label_{label_idx:03d}{suffix}"
+                    img_path = dir_prefix + img_filename
+                    show = done % preview_every == 0 or done == num_labels
+                    writes.append((writer.submit(write_file, img_path, blob), img_filename, blob if show else None))
+                    
+                    # Add filename to metadata and write its row right away
+                    metadata["image_filename"] = img_filename
+                    metadata_writer.write(metadata)
+                    saved = done
+                    
+                    if len(writes) >= max_writes:
+                        self.finish_write(*writes.popleft())
+                # Cancels the labels not started yet when stopped early
+                labels.close()
+                while writes:
+                    self.finish_write(*writes.popleft())
+                
+            self.log_message.emit(f"Metadata saved to: {metadata_writer.csv_path} and {metadata_writer.txt_path}")
+            if self.stopped:
+                self.log_message.emit(f"Stopped after generating {saved} of {num_labels} labels in '{out_dir}'")
             else:
-                dpi = self.settings.fixed_dpi
-            
-            # Save image
-            img_filename = f"label_{label_idx:03d}.{self.settings.output_format}"
-            img_path = os.path.join(self.settings.output_dir, img_filename)
-            
-            # Set save parameters
-            save_params = {}
-            
-            # Add DPI information for supported formats
-            if self.settings.output_format.lower() in ['png', 'jpg', 'jpeg', 'tiff']:
-                save_params['dpi'] = (dpi, dpi)
-            
-            # Convert to RGB if saving as JPG
-            if self.settings.output_format.lower() in ['jpg', 'jpeg']:
-                if image.mode in ['RGBA', 'LA']:
-                    # Use specified background color for JPG conversion
-                    bg_color = metadata['background']
-                    if bg_color == "transparent":
-                        bg_color = "#FFFFFF"  # Default to white for transparent
-                    background = Image.new('RGB', image.size, bg_color)
-                    background.paste(image, mask=image.split()[3] if image.mode == 'RGBA' else None)
-                    image = background
-                save_params['quality'] = 95
-            
-            # Save the image
-            image.save(img_path, **save_params)
-            
-            # Add filename to metadata
-            metadata["image_filename"] = img_filename
-            generator.metadata.append(metadata)
-            
-            # Emit log message
-            self.log_message.emit(f"Generated label: {img_filename}")
-            
-            # Emit signal with the generated image path for preview
-            self.image_generated.emit(img_path)
-            
-        # Save metadata after all labels are generated
-        csv_path, txt_path = generator.save_metadata()
-        self.log_message.emit(f"Metadata saved to: {csv_path} and {txt_path}")
-        self.log_message.emit(f"Successfully generated {self.settings.num_labels} labels in '{self.settings.output_dir}'")
-        
-        self.finished.emit()
+                self.log_message.emit(f"Successfully generated {num_labels} labels in '{out_dir}'")
+        except Exception as e:
+            self.log_message.emit(f"Error during generation: {str(e)}")
+        finally:
+            if labels is not None:
+                labels.close()
+            # Writes still queued after an error are dropped
+            writes.clear()
+            writer.shutdown(cancel_futures=True)
+            self.finished.emit()
+        
+    def finish_write(self, future, img_filename, preview_blob):
+        """Wait for a label file to be written, then report it"""
+        future.result()
+        
+        # Emit log message
+        self.log_message.emit(f"Generated label: {img_filename}")
+        
+        # Emit the decoded, downscaled label for preview
+        if preview_blob is not None:
+            image = QImage.fromData(preview_blob)
+            if image.isNull():
+                return
+            if self.preview_size is not None:
+                image = image.scaled(
+                    self.preview_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            self.image_generated.emit(image)
         
     def stop(self):
         """Stop the generation process"""
@@ -1524,6 +1775,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.settings = LabelGeneratorSettings()
         self.settings.update_calculated_properties()
+        self.setStyleSheet(_MAIN_WINDOW_STYLE)  # Shared by the comment labels of all tabs
         self.init_ui()
         
     def init_ui(self):
@@ -1602,6 +1854,7 @@ class MainWindow(QMainWindow):
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setStyleSheet("font-family: monospace;")
+        self.output_text.document().setMaximumBlockCount(2000)  # Keep the last lines only
         output_layout.addWidget(self.output_text)
         output_group.setLayout(output_layout)
         
@@ -1613,8 +1866,17 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(bottom_layout)
         
         # Redirect stdout and stderr to the output text widget
-        sys.stdout = OutputStream(self.output_text)
-        sys.stderr = OutputStream(self.output_text)
+        # Both share one stream so their lines stay in order. Bursts of writes
+        # are collected and inserted at most every 50 ms
+        self._output_buf = []
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.setInterval(50)
+        self._output_timer.timeout.connect(self.flush_output)
+        self.output_stream = OutputStream()
+        self.output_stream.text_ready.connect(self.append_output, Qt.ConnectionType.QueuedConnection)
+        sys.stdout = self.output_stream
+        sys.stderr = self.output_stream
         
         # Control buttons
         button_layout = QHBoxLayout()
@@ -1641,10 +1903,34 @@ class MainWindow(QMainWindow):
         # Initialize generation thread
         self.generation_thread = None
         
+    def append_output(self, text):
+        """Collect console text, the flush timer inserts it in one go"""
+        self._output_buf.append(text)
+        if not self._output_timer.isActive():
+            self._output_timer.start()
+            
+    def flush_output(self):
+        """Append the collected console text to the output widget"""
+        if not self._output_buf:
+            return
+        text = ''.join(self._output_buf)
+        self._output_buf.clear()
+        cursor = self.output_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.output_text.setTextCursor(cursor)
+        self.output_text.ensureCursorVisible()
+        
+    def flush_tab_settings(self):
+        """Commit setting changes the tabs are still holding back"""
+        for i in range(self.tabs.count()):
+            self.tabs.widget(i).flush_pending_settings()
+            
     def start_generation(self):
         """Start the label generation process"""
         # Clear the output text widget
         self.output_text.clear()
+        self.flush_tab_settings()
         
         # Validate settings
         if not self.validate_settings():
@@ -1662,7 +1948,7 @@ class MainWindow(QMainWindow):
             return
             
         # Create and start generation thread
-        self.generation_thread = GenerationThread(self.settings)
+        self.generation_thread = GenerationThread(self.settings, self.preview_label.size())
         self.generation_thread.progress_updated.connect(self.update_progress)
         self.generation_thread.image_generated.connect(self.update_preview)
         self.generation_thread.log_message.connect(self.output_text.append)
@@ -1693,18 +1979,9 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(value)
         self.status_label.setText(message)
         
-    def update_preview(self, image_path):
-        """Update the preview with the generated image"""
-        pixmap = QPixmap(image_path)
-        if not pixmap.isNull():
-            # Scale pixmap to fit label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.preview_label.width(), 
-                self.preview_label.height(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.preview_label.setPixmap(scaled_pixmap)
+    def update_preview(self, image):
+        """Update the preview with the generated image, already scaled to fit"""
+        self.preview_label.setPixmap(QPixmap.fromImage(image))
         
     def validate_settings(self):
         """Validate settings before starting generation"""
@@ -1796,6 +2073,7 @@ class MainWindow(QMainWindow):
         
     def save_settings(self):
         """Save current settings to a JSON file"""
+        self.flush_tab_settings()
         file_path, _ = QFileDialog.getSaveFileName(
             self, 
             "Save Settings", 
@@ -1805,15 +2083,7 @@ class MainWindow(QMainWindow):
         
         if file_path:
             # Extract settings to save
-            settings_dict = {}
-            for attr in dir(self.settings):
-                if not attr.startswith("__") and not callable(getattr(self.settings, attr)):
-                    value = getattr(self.settings, attr)
-                    # Convert lists and other types to JSON-serializable format
-                    if isinstance(value, (list, tuple, dict, str, int, float, bool, type(None))):
-                        settings_dict[attr] = value
-                    elif hasattr(value, '__dict__'):
-                        settings_dict[attr] = value.__dict__
+            settings_dict = {attr: getattr(self.settings, attr) for attr in _PERSISTED_FIELDS}
             
             # Save to file
             try:
@@ -1851,10 +2121,10 @@ class MainWindow(QMainWindow):
                     # Old format: only has 'units' list
                     settings_dict['available_units'] = settings_dict['units']
             
-                # Apply loaded settings
-                for key, value in settings_dict.items():
-                    if hasattr(self.settings, key):
-                        setattr(self.settings, key, value)
+                # Apply loaded settings, other keys in the file are ignored
+                for key in _PERSISTED_FIELDS:
+                    if key in settings_dict:
+                        setattr(self.settings, key, settings_dict[key])
             
                 # Update calculated properties
                 self.settings.update_calculated_properties()
@@ -1875,26 +2145,9 @@ class MainWindow(QMainWindow):
                 )
     
     def refresh_tabs(self):
-        """Refresh all tabs with current settings"""
-        # Store current tab index
-        current_index = self.tabs.currentIndex()
-        
-        # Remove old tabs
+        """Show the current settings in all tabs, updating their widgets in place"""
         for i in range(self.tabs.count()):
-            self.tabs.removeTab(0)
-        
-        # Add new tabs with updated settings in correct order
-        self.tabs.addTab(GeneralSettingsTab(self.settings), "General Settings")
-        self.tabs.addTab(TextContentSettingsTab(self.settings), "Text & Content")
-        self.tabs.addTab(UnitsOptionsSettingsTab(self.settings), "Options for Units")
-        self.tabs.addTab(FontStyleSettingsTab(self.settings), "Font & Style")
-        self.tabs.addTab(VintageBackgroundSettingsTab(self.settings), "Vintage & Background Effects")  # New tab
-        self.tabs.addTab(RotationEffectsSettingsTab(self.settings), "Rotation Effects")
-        self.tabs.addTab(SizeResolutionSettingsTab(self.settings), "Size & Resolution")
-        
-        # Restore previous tab
-        if 0 <= current_index < self.tabs.count():
-            self.tabs.setCurrentIndex(current_index)
+            self.tabs.widget(i).apply_settings()
 
 
 if __name__ == "__main__":